@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from .models import Alumni, EducationHistory, JobHistory, ScrapingLog, ScrapingQueue
 
@@ -72,6 +72,31 @@ def get_alumni_by_id(db: Session, alumni_id: int) -> Optional[Alumni]:
     return db.query(Alumni).filter(Alumni.id == alumni_id).first()
 
 
+def get_alumni_detail(db: Session, alumni_id: int) -> Optional[Alumni]:
+    """
+    Get an alumni record with its job and education history loaded.
+    
+    Both collections are fetched with one batched SELECT each, so the
+    detail view needs no further queries.
+    
+    Args:
+        db: Database session.
+        alumni_id: Alumni ID.
+    
+    Returns:
+        Alumni object or None if not found.
+    """
+    return (
+        db.query(Alumni)
+        .options(
+            selectinload(Alumni.job_history),
+            selectinload(Alumni.education_history),
+        )
+        .filter(Alumni.id == alumni_id)
+        .one_or_none()
+    )
+
+
 def get_alumni_by_roll_number(db: Session, roll_number: str) -> Optional[Alumni]:
     """
     Get an alumni record by roll number.
@@ -254,6 +279,24 @@ def delete_alumni(db: Session, alumni_id: int) -> bool:
     return True
 
 
+def _distinct_values(db: Session, column) -> list[str]:
+    """
+    Get the distinct non-empty values of an Alumni column.
+    
+    NULL and empty values are filtered out in SQL alongside the DISTINCT,
+    rather than after fetching every distinct value into Python.
+    
+    Args:
+        db: Database session.
+        column: Alumni column attribute, e.g. Alumni.batch.
+    
+    Returns:
+        List of unique values.
+    """
+    query = db.query(column).filter(column.isnot(None), column != "").distinct()
+    return [value for (value,) in query]
+
+
 def get_unique_batches(db: Session) -> list[str]:
     """
     Get all unique batch values.
@@ -264,8 +307,7 @@ def get_unique_batches(db: Session) -> list[str]:
     Returns:
         List of unique batch values.
     """
-    result = db.query(Alumni.batch).distinct().all()
-    return [r[0] for r in result if r[0]]
+    return _distinct_values(db, Alumni.batch)
 
 
 def get_unique_companies(db: Session) -> list[str]:
@@ -278,8 +320,7 @@ def get_unique_companies(db: Session) -> list[str]:
     Returns:
         List of unique company values.
     """
-    result = db.query(Alumni.current_company).distinct().all()
-    return [r[0] for r in result if r[0]]
+    return _distinct_values(db, Alumni.current_company)
 
 
 def get_unique_locations(db: Session) -> list[str]:
@@ -292,8 +333,7 @@ def get_unique_locations(db: Session) -> list[str]:
     Returns:
         List of unique location values.
     """
-    result = db.query(Alumni.location).distinct().all()
-    return [r[0] for r in result if r[0]]
+    return _distinct_values(db, Alumni.location)
 
 
 # =============================================================================
@@ -339,6 +379,20 @@ def get_job_history_by_alumni(db: Session, alumni_id: int) -> list[JobHistory]:
     )
 
 
+def count_job_history(db: Session, alumni_id: int) -> int:
+    """
+    Count the job history records of an alumni.
+    
+    Args:
+        db: Database session.
+        alumni_id: Alumni ID.
+    
+    Returns:
+        Number of JobHistory records.
+    """
+    return db.query(JobHistory).filter(JobHistory.alumni_id == alumni_id).count()
+
+
 def delete_job_history(db: Session, job_id: int) -> bool:
     """
     Delete a job history record.
@@ -402,6 +456,20 @@ def get_education_history_by_alumni(db: Session, alumni_id: int) -> list[Educati
     )
 
 
+def count_education_history(db: Session, alumni_id: int) -> int:
+    """
+    Count the education history records of an alumni.
+    
+    Args:
+        db: Database session.
+        alumni_id: Alumni ID.
+    
+    Returns:
+        Number of EducationHistory records.
+    """
+    return db.query(EducationHistory).filter(EducationHistory.alumni_id == alumni_id).count()
+
+
 def delete_education_history(db: Session, education_id: int) -> bool:
     """
     Delete an education history record.
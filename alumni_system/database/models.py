@@ -81,12 +81,18 @@ class Alumni(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_scraped_at = Column(DateTime)
     
-    # Relationships
+    # Relationships (ordered like the get_*_history_by_alumni queries)
     job_history = relationship(
-        "JobHistory", back_populates="alumni", cascade="all, delete-orphan"
+        "JobHistory",
+        back_populates="alumni",
+        cascade="all, delete-orphan",
+        order_by="JobHistory.start_date.desc()",
     )
     education_history = relationship(
-        "EducationHistory", back_populates="alumni", cascade="all, delete-orphan"
+        "EducationHistory",
+        back_populates="alumni",
+        cascade="all, delete-orphan",
+        order_by="EducationHistory.end_year.desc()",
     )
 
     def __repr__(self) -> str:
@@ -7,14 +7,16 @@ accounts when limits are reached.
 """
 
 import os
+import sys
+from collections import deque
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import List, Optional
+from typing import List, Mapping, Optional
 
 from sqlalchemy.orm import Session
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkedInAccount:
     """
     Data class representing a LinkedIn account for scraping.
@@ -33,6 +35,12 @@ class LinkedInAccount:
     profiles_scraped_today: int = 0
     is_flagged: bool = False
     last_used: Optional[datetime] = None
+    
+    def __post_init__(self):
+        # Emails are compared on every usage update; interned strings
+        # short-circuit equality on identity
+        self.id = sys.intern(self.id)
+        self.email = sys.intern(self.email)
 
 
 class AccountRotationManager:
@@ -48,34 +56,51 @@ class AccountRotationManager:
     - Resets counters at midnight UTC
     """
     
-    def __init__(self, accounts: Optional[List[LinkedInAccount]] = None, daily_limit: Optional[int] = None):
+    def __init__(
+        self,
+        accounts: Optional[List[LinkedInAccount]] = None,
+        daily_limit: Optional[int] = None,
+        env: Optional[Mapping[str, str]] = None,
+    ):
         """
         Initialize the account rotation manager.
         
         Args:
             accounts: List of LinkedInAccount objects. If None, loads from environment.
             daily_limit: Maximum profiles per account per day. If None, reads from env.
+            env: Mapping to read configuration from. Defaults to os.environ.
         """
+        if env is None:
+            env = os.environ
+        
         if accounts is None:
-            self.accounts = self._load_accounts_from_env()
+            self.accounts = self._load_accounts_from_env(env)
         else:
             self.accounts = accounts
+        
+        # Email lookup for the per-account update methods; built in reverse so
+        # a duplicated email resolves to its first account, as a scan would
+        self._by_email = {account.email: account for account in reversed(self.accounts)}
             
         if daily_limit is None:
-            self.daily_limit = int(os.environ.get("SCRAPER_DAILY_LIMIT_PER_ACCOUNT", "80"))
+            self.daily_limit = int(env.get("SCRAPER_DAILY_LIMIT_PER_ACCOUNT", "80"))
         else:
             self.daily_limit = daily_limit
             
-        self._current_index = 0
         self._load_usage_from_db()
+        self._rebuild_available()
+        self._recount()
     
-    def _load_accounts_from_env(self) -> List[LinkedInAccount]:
+    def _load_accounts_from_env(self, env: Mapping[str, str]) -> List[LinkedInAccount]:
         """
         Load LinkedIn accounts from numbered environment variables.
         
         Reads LINKEDIN_EMAIL_N and LINKEDIN_PASSWORD_N where N starts at 1
         and continues until a gap is found in the sequence.
         
+        Args:
+            env: Mapping of environment variables to read from.
+        
         Returns:
             List of LinkedInAccount objects.
         
@@ -89,8 +114,8 @@ class AccountRotationManager:
             email_key = f"LINKEDIN_EMAIL_{n}"
             password_key = f"LINKEDIN_PASSWORD_{n}"
             
-            email = os.environ.get(email_key)
-            password = os.environ.get(password_key)
+            email = env.get(email_key)
+            password = env.get(password_key)
             
             # Stop when we hit a gap in the sequence
             if not email or not password:
@@ -152,6 +177,30 @@ class AccountRotationManager:
             print(f"Warning: Could not load usage from database: {e}")
             # Continue with zero usage if database unavailable
     
+    def _is_available(self, account: LinkedInAccount) -> bool:
+        """Check whether an account can still be used today."""
+        return not account.is_flagged and account.profiles_scraped_today < self.daily_limit
+    
+    def _rebuild_available(self) -> None:
+        """
+        Rebuild the rotation queue from the accounts that are available now.
+        
+        The queue keeps the configured account order. Accounts that become
+        unavailable are dropped lazily by get_next_account().
+        """
+        self._available = deque(a for a in self.accounts if self._is_available(a))
+    
+    def _remaining(self, account: LinkedInAccount) -> int:
+        """Profiles the account can still scrape today (0 if flagged)."""
+        if account.is_flagged:
+            return 0
+        return max(0, self.daily_limit - account.profiles_scraped_today)
+    
+    def _recount(self) -> None:
+        """Recompute the running capacity total and drop the cached stats."""
+        self._capacity = sum(self._remaining(a) for a in self.accounts)
+        self._stats = None
+    
     def get_next_account(self) -> Optional[LinkedInAccount]:
         """
         Get the next available account from the rotation pool.
@@ -163,22 +212,19 @@ class AccountRotationManager:
         Returns:
             LinkedInAccount object, or None if all accounts exhausted.
         """
-        # Try each account starting from current index
-        attempts = 0
-        while attempts < len(self.accounts):
-            account = self.accounts[self._current_index]
-            
-            # Move to next account for next call
-            self._current_index = (self._current_index + 1) % len(self.accounts)
-            attempts += 1
-            
-            # Check if account is available
-            if not account.is_flagged and account.profiles_scraped_today < self.daily_limit:
-                account.last_used = datetime.utcnow()
-                return account
+        # Drop accounts that were exhausted or flagged since they were queued
+        while self._available and not self._is_available(self._available[0]):
+            self._available.popleft()
         
-        # All accounts exhausted
-        return None
+        if not self._available:
+            # All accounts exhausted
+            return None
+        
+        # Move the selected account to the back for round-robin rotation
+        account = self._available[0]
+        self._available.rotate(-1)
+        account.last_used = datetime.utcnow()
+        return account
     
     def mark_account_exhausted(self, account_email: str) -> None:
         """
@@ -187,10 +233,12 @@ class AccountRotationManager:
         Args:
             account_email: Email of the account to mark as exhausted.
         """
-        for account in self.accounts:
-            if account.email == account_email:
-                account.profiles_scraped_today = self.daily_limit
-                break
+        account = self._by_email.get(account_email)
+        if account is not None:
+            before = self._remaining(account)
+            account.profiles_scraped_today = self.daily_limit
+            self._capacity -= before
+            self._stats = None
     
     def mark_account_flagged(self, account_email: str) -> None:
         """
@@ -199,10 +247,11 @@ class AccountRotationManager:
         Args:
             account_email: Email of the account to flag.
         """
-        for account in self.accounts:
-            if account.email == account_email:
-                account.is_flagged = True
-                break
+        account = self._by_email.get(account_email)
+        if account is not None:
+            self._capacity -= self._remaining(account)
+            account.is_flagged = True
+            self._stats = None
         
         # Update database
         try:
@@ -249,10 +298,12 @@ class AccountRotationManager:
             account_email: Email of the account to increment.
         """
         # Update in-memory counter
-        for account in self.accounts:
-            if account.email == account_email:
-                account.profiles_scraped_today += 1
-                break
+        account = self._by_email.get(account_email)
+        if account is not None:
+            if self._remaining(account) > 0:
+                self._capacity -= 1
+            account.profiles_scraped_today += 1
+            self._stats = None
         
         # Update database
         try:
@@ -300,11 +351,18 @@ class AccountRotationManager:
         for account in self.accounts:
             account.profiles_scraped_today = 0
             account.is_flagged = False
+        
+        self._rebuild_available()
+        self._capacity = len(self.accounts) * self.daily_limit
+        self._stats = None
     
     def get_usage_stats(self) -> dict:
         """
         Get usage statistics for all accounts.
         
+        The result is cached until the next usage change and shared between
+        callers, so treat it as read-only.
+        
         Returns:
             Dictionary with account emails as keys and usage info as values.
             Format: {
@@ -316,6 +374,9 @@ class AccountRotationManager:
                 }
             }
         """
+        if self._stats is not None:
+            return self._stats
+        
         stats = {}
         
         for account in self.accounts:
@@ -326,6 +387,7 @@ class AccountRotationManager:
                 "available": not account.is_flagged and account.profiles_scraped_today < self.daily_limit
             }
         
+        self._stats = stats
         return stats
     
     def get_total_available_capacity(self) -> int:
@@ -335,15 +397,8 @@ class AccountRotationManager:
         Returns:
             Total remaining capacity across all available accounts.
         """
-        total = 0
-        
-        for account in self.accounts:
-            if not account.is_flagged:
-                remaining = self.daily_limit - account.profiles_scraped_today
-                if remaining > 0:
-                    total += remaining
-        
-        return total
+        # Kept up to date by the usage methods instead of summed per call
+        return self._capacity
     
     def has_available_accounts(self) -> bool:
         """
@@ -61,4 +61,6 @@ SELECTORS = {
     "experience_section": 'section[id="experience"]',
     "education_section": 'section[id="education"]',
     "about_section": 'section[id="about"]',
+    "more_actions_button": 'button[aria-label="More actions"], button[id*="profile-overflow-action"]',
+    "save_to_pdf": 'div[aria-label="Save to PDF"][role="button"]',
 }
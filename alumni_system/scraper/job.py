@@ -14,6 +14,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
+from playwright.async_api import Browser, Playwright, async_playwright
 from sqlalchemy.orm import Session
 
 from ..database.connection import get_db_context
@@ -41,6 +42,7 @@ from ..utils.error_handling import (
     log_error,
 )
 from .account_rotation import AccountRotationManager
+from .config import HEADLESS_MODE, SLOW_MO
 from .linkedin_scraper import LinkedInScraper
 
 logger = get_logger(__name__)
@@ -339,6 +341,9 @@ class ScrapingJobOrchestrator:
         self.db = db
         self.account_manager = account_manager or AccountRotationManager()
         self.update_threshold_days = update_threshold_days
+        # One browser for the whole job; each profile gets its own context
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
         self.stats = {
             "total_processed": 0,
             "successful": 0,
@@ -350,6 +355,57 @@ class ScrapingJobOrchestrator:
             "errors": [],
         }
     
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+    
+    async def close(self) -> None:
+        """
+        Close the shared browser.
+        
+        The run_* methods close it when they finish; callers that drive
+        _process_profile() directly should use ``async with`` or call this.
+        """
+        await self._close_browser()
+    
+    async def _get_browser(self) -> Browser:
+        """
+        Get the browser shared by this job's scrapers, launching it on first use.
+        
+        A browser that has crashed or disconnected is discarded and a new one
+        launched, so one dead browser does not fail the rest of the job.
+        
+        Returns:
+            Running Playwright Browser instance.
+        """
+        if self._browser is not None and not self._browser.is_connected():
+            logger.warning("Shared browser disconnected, launching a new one")
+            await self._close_browser()
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=HEADLESS_MODE,
+                slow_mo=SLOW_MO,
+            )
+        return self._browser
+    
+    async def _close_browser(self) -> None:
+        """Close the shared browser, if one was launched."""
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                # A crashed browser may fail to close; it is dropped either way
+                logger.warning(f"Error closing browser: {e}")
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+    
     async def run_queue_based_scraping(
         self,
         max_profiles: Optional[int] = None,
@@ -369,51 +425,55 @@ class ScrapingJobOrchestrator:
         
         processed_count = 0
         
-        while True:
-            # Check if we've reached max profiles
-            if max_profiles and processed_count >= max_profiles:
-                logger.info(f"Reached max profiles limit: {max_profiles}")
-                break
-            
-            # Get next item from queue
-            queue_item = get_next_from_queue(self.db)
-            if not queue_item:
-                logger.info("Queue is empty, stopping")
-                break
-            
-            # Get alumni record
-            alumni = get_alumni_by_id(self.db, queue_item.alumni_id)
-            if not alumni:
-                logger.warning(f"Alumni {queue_item.alumni_id} not found, marking as failed")
-                mark_queue_item_failed(self.db, queue_item.id)
-                self.stats["failed"] += 1
-                continue
-            
-            # Check if profile needs updating (unless force_update is True)
-            if not force_update and alumni.last_scraped_at:
-                threshold_date = datetime.utcnow() - timedelta(days=self.update_threshold_days)
-                if alumni.last_scraped_at >= threshold_date:
-                    logger.info(f"Alumni {alumni.id} was recently scraped, skipping")
-                    mark_queue_item_complete(self.db, queue_item.id)
-                    self.stats["skipped"] += 1
-                    processed_count += 1
+        try:
+            while True:
+                # Check if we've reached max profiles
+                if max_profiles and processed_count >= max_profiles:
+                    logger.info(f"Reached max profiles limit: {max_profiles}")
+                    break
+                
+                # Get next item from queue
+                queue_item = get_next_from_queue(self.db)
+                if not queue_item:
+                    logger.info("Queue is empty, stopping")
+                    break
+                
+                # Get alumni record
+                alumni = get_alumni_by_id(self.db, queue_item.alumni_id)
+                if not alumni:
+                    logger.warning(f"Alumni {queue_item.alumni_id} not found, marking as failed")
+                    mark_queue_item_failed(self.db, queue_item.id)
+                    self.stats["failed"] += 1
                     continue
-            
-            # Mark as in progress
-            mark_queue_item_in_progress(self.db, queue_item.id)
-            
-            # Process the profile
-            success = await self._process_profile(alumni, queue_item.id)
-            
-            if success:
-                mark_queue_item_complete(self.db, queue_item.id)
-                self.stats["successful"] += 1
-            else:
-                mark_queue_item_failed(self.db, queue_item.id)
-                self.stats["failed"] += 1
-            
-            self.stats["total_processed"] += 1
-            processed_count += 1
+                
+                # Check if profile needs updating (unless force_update is True)
+                if not force_update and alumni.last_scraped_at:
+                    threshold_date = datetime.utcnow() - timedelta(days=self.update_threshold_days)
+                    if alumni.last_scraped_at >= threshold_date:
+                        logger.info(f"Alumni {alumni.id} was recently scraped, skipping")
+                        mark_queue_item_complete(self.db, queue_item.id)
+                        self.stats["skipped"] += 1
+                        processed_count += 1
+                        continue
+                
+                # Mark as in progress
+                mark_queue_item_in_progress(self.db, queue_item.id)
+                
+                # Process the profile
+                success = await self._process_profile(alumni, queue_item.id)
+                
+                if success:
+                    mark_queue_item_complete(self.db, queue_item.id)
+                    self.stats["successful"] += 1
+                else:
+                    mark_queue_item_failed(self.db, queue_item.id)
+                    self.stats["failed"] += 1
+                
+                self.stats["total_processed"] += 1
+                processed_count += 1
+        
+        finally:
+            await self._close_browser()
         
         self.stats["completed_at"] = datetime.utcnow().isoformat()
         logger.info(f"Scraping job completed: {self.stats}")
@@ -459,15 +519,18 @@ class ScrapingJobOrchestrator:
             return self.stats
         
         # Process each profile
-        for alumni in alumni_to_process:
-            success = await self._process_profile(alumni)
-            
-            if success:
-                self.stats["successful"] += 1
-            else:
-                self.stats["failed"] += 1
-            
-            self.stats["total_processed"] += 1
+        try:
+            for alumni in alumni_to_process:
+                success = await self._process_profile(alumni)
+                
+                if success:
+                    self.stats["successful"] += 1
+                else:
+                    self.stats["failed"] += 1
+                
+                self.stats["total_processed"] += 1
+        finally:
+            await self._close_browser()
         
         self.stats["completed_at"] = datetime.utcnow().isoformat()
         logger.info(f"Scraping job completed: {self.stats}")
@@ -481,6 +544,9 @@ class ScrapingJobOrchestrator:
         """
         Process a single alumni profile with account rotation and error handling.
         
+        Launches the shared browser if needed and leaves it open for the next
+        profile; it is closed by the run_* methods, close() or ``async with``.
+        
         Args:
             alumni: Alumni record to process.
             queue_id: Optional queue item ID for logging.
@@ -518,8 +584,9 @@ class ScrapingJobOrchestrator:
             logger.info(f"Processing alumni {alumni.id} with account {account.email}")
             
             try:
-                # Create scraper with specific account
-                async with LinkedInScraper(account=account) as scraper:
+                # Create scraper with specific account in the shared browser
+                browser = await self._get_browser()
+                async with LinkedInScraper(account=account, browser=browser) as scraper:
                     # Login
                     login_success = await scraper.login(account)
                     if not login_success:
@@ -42,7 +42,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
 
 from .account_rotation import LinkedInAccount
 from .config import (
@@ -68,7 +68,13 @@ class LinkedInScraper:
     - PDF download of profiles
     """
 
-    def __init__(self, account: Optional[LinkedInAccount] = None, cookies_file: Optional[str] = None):
+    def __init__(
+        self,
+        account: Optional[LinkedInAccount] = None,
+        cookies_file: Optional[str] = None,
+        cookies: Optional[bytes] = None,
+        browser: Optional[Browser] = None,
+    ):
         """
         Initialize the LinkedIn scraper.
         
@@ -76,13 +82,20 @@ class LinkedInScraper:
             account: LinkedInAccount to use for authentication. If None, uses legacy credentials.
             cookies_file: Path to cookies JSON file for cookie-based authentication.
                          If provided, takes precedence over account credentials.
+            cookies: Raw contents of a cookies JSON file that the caller has already read.
+                     When given, cookies_file is not opened or stat()ed again.
+            browser: Already-running Browser to open this scraper's context in.
+                     The caller keeps ownership; close() leaves it running.
         """
-        self._browser: Optional[Browser] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = browser
+        self._owns_browser = browser is None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
         self._logged_in = False
         self._account = account
         self._cookies_file = cookies_file
+        self._cookies_data = cookies
         self._current_account_email: Optional[str] = None
 
     async def __aenter__(self):
@@ -95,12 +108,13 @@ class LinkedInScraper:
         await self.close()
 
     async def start(self) -> None:
-        """Start the browser and initialize context."""
-        playwright = await async_playwright().start()
-        self._browser = await playwright.chromium.launch(
-            headless=HEADLESS_MODE,
-            slow_mo=SLOW_MO,
-        )
+        """Start the browser (unless one was supplied) and initialize context."""
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=HEADLESS_MODE,
+                slow_mo=SLOW_MO,
+            )
         self._context = await self._browser.new_context(
             viewport={"width": 1920, "height": 1080},
             user_agent=(
@@ -111,9 +125,13 @@ class LinkedInScraper:
             accept_downloads=True,  # Enable download handling
         )
         
+        # Read the cookies file once; login() reuses the cached bytes
+        if self._cookies_data is None and self._cookies_file and os.path.isfile(self._cookies_file):
+            self._cookies_data = Path(self._cookies_file).read_bytes()
+        
         # Load cookies BEFORE creating page
-        if self._cookies_file and os.path.exists(self._cookies_file):
-            print(f"Loading cookies from: {self._cookies_file}")
+        if self._cookies_data is not None:
+            print(f"Loading cookies from: {self._cookies_file or 'memory'}")
             await self._load_cookies()
             print("✅ Cookies loaded into context")
         
@@ -124,10 +142,17 @@ class LinkedInScraper:
         """Close the browser and cleanup resources."""
         if self._page:
             await self._page.close()
+            self._page = None
         if self._context:
             await self._context.close()
-        if self._browser:
+            self._context = None
+        if self._browser and self._owns_browser:
+            # Forget the closed browser so a later start() launches a new one
             await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
     async def _random_delay(self) -> None:
         """Add a random delay to avoid detection."""
@@ -136,17 +161,16 @@ class LinkedInScraper:
     
     async def _load_cookies(self) -> bool:
         """
-        Load cookies from file into browser context.
+        Load cookies read by start() (or passed in) into browser context.
         
         Returns:
             True if cookies loaded successfully, False otherwise.
         """
         try:
-            with open(self._cookies_file, 'r') as f:
-                cookies = json.load(f)
+            cookies = json.loads(self._cookies_data)
             
             await self._context.add_cookies(cookies)
-            print(f"Loaded {len(cookies)} cookies from {self._cookies_file}")
+            print(f"Loaded {len(cookies)} cookies from {self._cookies_file or 'memory'}")
             
             # Try to extract email from cookies for tracking
             for cookie in cookies:
@@ -260,7 +284,7 @@ class LinkedInScraper:
             return True
 
         # Try cookie-based authentication first
-        if self._cookies_file and os.path.exists(self._cookies_file):
+        if self._cookies_data is not None:
             print("Attempting cookie-based authentication...")
             if await self.verify_cookie_auth():
                 return True
@@ -630,10 +654,9 @@ class LinkedInScraper:
         try:
             await self._random_delay()
             print(f"   Navigating to profile: {linkedin_url}")
-            await self._page.goto(linkedin_url, wait_until="networkidle")
-            
-            # Wait for page to fully load
-            await asyncio.sleep(3)
+            # The "More" button lookup below waits for the control itself,
+            # so there is no need to wait for the network to go idle here
+            await self._page.goto(linkedin_url, wait_until="domcontentloaded")
             
             # Check for security checkpoint
             if "checkpoint" in self._page.url or "challenge" in self._page.url:
@@ -647,9 +670,8 @@ class LinkedInScraper:
             
             # Try to find the More button with various selectors
             more_selectors = [
-                'button[aria-label="More actions"]',
+                SELECTORS["more_actions_button"],
                 'button.artdeco-dropdown__trigger:has-text("More")',
-                'button[id*="profile-overflow-action"]',
                 'button[aria-label*="More"]',
             ]
             
@@ -676,7 +698,13 @@ class LinkedInScraper:
             # Click the More button
             print("   Clicking 'More' button...")
             await more_button.click()
-            await asyncio.sleep(1.5)
+            try:
+                # Resolves as soon as the menu renders instead of a fixed sleep
+                await self._page.wait_for_selector(
+                    '[aria-label="Save to PDF"]', state="visible", timeout=10000
+                )
+            except Exception:
+                pass  # the selector loop below still tries 'text=Save to PDF'
             print("   ✅ 'More' menu opened")
             print()
             
@@ -690,7 +718,7 @@ class LinkedInScraper:
                     
                     # Click "Save to PDF" - try multiple selectors based on actual HTML
                     save_pdf_selectors = [
-                        'div[aria-label="Save to PDF"][role="button"]',
+                        SELECTORS["save_to_pdf"],
                         'div[aria-label="Save to PDF"]',
                         '[aria-label="Save to PDF"]',
                         'text=Save to PDF',
@@ -0,0 +1,132 @@
+"""
+Shared Playwright browser for the debug/test scripts.
+
+Launching Chromium dominates the wall time of these single-profile scripts,
+so they share one browser per process and open a fresh context per run.
+A batch driver can wrap several runs in an outer ``shared_browser()`` block
+to keep the same browser alive across all of them.
+"""
+
+import json
+import os
+import stat
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from playwright.async_api import Browser, Playwright, async_playwright
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_users = 0
+
+
+@asynccontextmanager
+async def shared_browser(headless: bool = True, slow_mo: int = 0) -> AsyncIterator[Browser]:
+    """
+    Yield the process-wide browser, launching it on first use.
+
+    The launch options only apply to the first (outermost) caller; the
+    browser is closed when the outermost block exits.
+
+    Args:
+        headless: Run Chromium without a visible window.
+        slow_mo: Milliseconds to wait before every Playwright action.
+
+    Yields:
+        Shared Playwright Browser instance.
+    """
+    global _playwright, _browser, _users
+
+    if _browser is None or not _browser.is_connected():
+        # A disconnected browser is relaunched on the running driver rather
+        # than starting a second one that the exit path would never stop
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        _browser = await _playwright.chromium.launch(headless=headless, slow_mo=slow_mo)
+
+    _users += 1
+    try:
+        yield _browser
+    finally:
+        _users -= 1
+        if _users == 0:
+            await _browser.close()
+            await _playwright.stop()
+            _browser = None
+            _playwright = None
+
+
+@lru_cache(maxsize=8)
+def _parse_cookies(cookies_file: str, mtime: float) -> list[dict]:
+    """Parse a cookies file; mtime is part of the cache key so edits are picked up."""
+    data = Path(cookies_file).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def check_cookies(cookies_file: str) -> Optional[os.stat_result]:
+    """
+    Stat a cookies file once, rejecting missing, unreadable, empty or
+    non-regular files (such as directories).
+
+    The returned st_mtime can be passed on to load_cookies()/storage_state()
+    so they don't need to stat the file again.
+
+    Args:
+        cookies_file: Path to the cookies JSON file.
+
+    Returns:
+        The file's stat result, or None if it cannot be stat()ed, is not a
+        regular file, or is zero bytes.
+    """
+    try:
+        st = os.stat(cookies_file)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) and st.st_size > 0 else None
+
+
+def load_cookies(cookies_file: str, mtime: Optional[float] = None) -> list[dict]:
+    """
+    Load an exported cookies JSON file, reusing the parsed result while
+    the file is unchanged.
+
+    Uses orjson when it is installed, otherwise the standard json module.
+
+    Args:
+        cookies_file: Path to the cookies JSON file (list of cookie dicts).
+        mtime: Modification time from check_cookies(); looked up if omitted.
+
+    Returns:
+        List of cookie dictionaries. Treat it as read-only; it is shared.
+    """
+    if mtime is None:
+        mtime = os.path.getmtime(cookies_file)
+    return _parse_cookies(cookies_file, mtime)
+
+
+def storage_state(cookies_file: str, mtime: Optional[float] = None) -> dict:
+    """
+    Build a Playwright storage_state from an exported cookies JSON file.
+
+    Passing this to ``browser.new_context(storage_state=...)`` installs the
+    cookies when the context is created, instead of a separate add_cookies call.
+
+    Args:
+        cookies_file: Path to the cookies JSON file (list of cookie dicts).
+        mtime: Modification time from check_cookies(); looked up if omitted.
+
+    Returns:
+        Storage state dictionary with the cookies and no origins.
+    """
+    return {"cookies": load_cookies(cookies_file, mtime), "origins": []}
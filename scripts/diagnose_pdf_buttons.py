@@ -26,12 +26,14 @@ async def diagnose_buttons():
     print(f"Profile: {test_profile}")
     print()
     
-    if not os.path.exists(cookies_file):
+    cookies_path = Path(cookies_file)
+    
+    if not cookies_path.is_file():
         print(f"❌ Cookies file not found: {cookies_file}")
         return False
     
     try:
-        async with LinkedInScraper(cookies_file=cookies_file) as scraper:
+        async with LinkedInScraper(cookies_file=cookies_file, cookies=cookies_path.read_bytes()) as scraper:
             # Authenticate
             if not await scraper.verify_cookie_auth():
                 print("❌ Authentication failed")
@@ -178,7 +178,13 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    # Prompts would hang or hit EOF when stdin is a pipe (CI, containers)
+    _INTERACTIVE = sys.stdin.isatty()
+    
     if args.setup:
+        if not _INTERACTIVE:
+            print("❌ --setup requires an interactive terminal")
+            sys.exit(2)
         success = setup_b2()
         sys.exit(0 if success else 1)
     elif args.test:
@@ -193,6 +199,8 @@ if __name__ == "__main__":
             print()
             print("To update credentials, run:")
             print("  python3 scripts/setup_b2.py --setup")
+        elif not _INTERACTIVE:
+            sys.exit(1)
         else:
             print()
             print("Would you like to setup B2 now? (y/n): ", end="")
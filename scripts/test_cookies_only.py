@@ -24,7 +24,8 @@ async def test_cookies():
     cookies_file = "cookies/linkedin_cookies_1_fixed.json"
     
     # Check if cookies file exists
-    if not Path(cookies_file).exists():
+    cookies_path = Path(cookies_file)
+    if not cookies_path.is_file():
         print(f"❌ Cookies file not found: {cookies_file}")
         print()
         print("Solution:")
@@ -51,7 +52,7 @@ async def test_cookies():
     print()
     
     try:
-        async with LinkedInScraper(cookies_file=cookies_file) as scraper:
+        async with LinkedInScraper(cookies_file=cookies_file, cookies=cookies_path.read_bytes()) as scraper:
             print("✅ Scraper initialized")
             print()
             
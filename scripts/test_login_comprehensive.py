@@ -24,7 +24,8 @@ async def test_login():
     cookies_file = "cookies/linkedin_cookies_1_fixed.json"
     
     # Check if cookies file exists
-    if not Path(cookies_file).exists():
+    cookies_path = Path(cookies_file)
+    if not cookies_path.is_file():
         print(f"❌ Cookies file not found: {cookies_file}")
         print()
         print("Solution:")
@@ -42,7 +43,7 @@ async def test_login():
     print()
     
     try:
-        scraper = LinkedInScraper(cookies_file=cookies_file)
+        scraper = LinkedInScraper(cookies_file=cookies_file, cookies=cookies_path.read_bytes())
         await scraper.start()
         print("✅ Scraper started")
         print()
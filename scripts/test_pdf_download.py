@@ -23,7 +23,9 @@ async def test_pdf_download():
     cookies_file = "cookies/linkedin_cookies_1_fixed.json"
     profile_url = "https://www.linkedin.com/in/akshat-naugir-4509a9202"
     
-    if not Path(cookies_file).exists():
+    cookies_path = Path(cookies_file)
+    
+    if not cookies_path.is_file():
         print(f"❌ Cookies file not found: {cookies_file}")
         return
     
@@ -31,7 +33,7 @@ async def test_pdf_download():
     print()
     
     try:
-        async with LinkedInScraper(cookies_file=cookies_file) as scraper:
+        async with LinkedInScraper(cookies_file=cookies_file, cookies=cookies_path.read_bytes()) as scraper:
             print("Logging in...")
             if not await scraper.login():
                 print("❌ Login failed")
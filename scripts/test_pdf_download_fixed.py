@@ -30,13 +30,15 @@ async def test_pdf_download():
     print(f"Cookies: {cookies_file}")
     print()
     
-    if not os.path.exists(cookies_file):
+    cookies_path = Path(cookies_file)
+    
+    if not cookies_path.is_file():
         print(f"❌ Cookies file not found: {cookies_file}")
         print("Please run manual_login_and_save.py first to save cookies.")
         return False
     
     try:
-        async with LinkedInScraper(cookies_file=cookies_file) as scraper:
+        async with LinkedInScraper(cookies_file=cookies_file, cookies=cookies_path.read_bytes()) as scraper:
             print("Step 1: Verifying authentication...")
             if not await scraper.verify_cookie_auth():
                 print("❌ Cookie authentication failed")
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Test PDF download with detailed debugging to see what's happening.
+
+Runs headless with no artificial delay by default. Set PW_HEADFUL=1 to show
+the browser and PW_SLOW_MO=500 to slow each action down so you can follow it.
 """
 
 import asyncio
@@ -10,7 +13,20 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from playwright.async_api import async_playwright
+from alumni_system.scraper.config import SELECTORS
+
+from _playwright_pool import check_cookies, shared_browser, storage_state
+
+# Set PW_DEBUG_SHOTS=1 to save a screenshot at each step
+DEBUG_SHOTS = os.getenv("PW_DEBUG_SHOTS") == "1"
+
+# Every known "More actions" selector, matched in a single DOM query
+MORE_BUTTON_SELECTOR = (
+    f'{SELECTORS["more_actions_button"]}, '
+    'button:has-text("More"), '
+    'button[aria-label*="More"], '
+    '.pvs-profile-actions button'
+)
 
 
 async def test_pdf_download_debug():
@@ -25,85 +41,89 @@ async def test_pdf_download_debug():
     print(f"Profile: {test_profile}")
     print()
     
-    if not os.path.exists(cookies_file):
-        print(f"❌ Cookies file not found: {cookies_file}")
+    cookies_stat = check_cookies(cookies_file)
+    if cookies_stat is None:
+        print(f"❌ Cookies file not found or empty: {cookies_file}")
         return False
     
     try:
-        # Start Playwright
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=False,  # Show browser so we can see what's happening
-            slow_mo=500,     # Slow down so we can see
-        )
-        
-        context = await browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            accept_downloads=True,  # CRITICAL: Enable downloads
-        )
-        
-        # Load cookies
-        import json
-        with open(cookies_file, 'r') as f:
-            cookies = json.load(f)
-        await context.add_cookies(cookies)
-        print(f"✅ Loaded {len(cookies)} cookies")
+        async with shared_browser(
+            headless=os.getenv("PW_HEADFUL", "0") != "1",
+            slow_mo=int(os.getenv("PW_SLOW_MO", "0")),
+        ) as browser:
+            return await _download_pdf(browser, test_profile, cookies_file, cookies_stat.st_mtime)
         
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+async def _download_pdf(browser, test_profile: str, cookies_file: str, cookies_mtime: float) -> bool:
+    """Run the Save to PDF flow in a fresh context on the shared browser."""
+    
+    # Cookies are installed with the context via storage_state
+    state = storage_state(cookies_file, cookies_mtime)
+    context = await browser.new_context(
+        viewport={"width": 1920, "height": 1080},
+        accept_downloads=True,  # CRITICAL: Enable downloads
+        storage_state=state,
+    )
+    print(f"✅ Loaded {len(state['cookies'])} cookies")
+    
+    try:
         page = await context.new_page()
         
         # Navigate to profile
         print(f"Navigating to: {test_profile}")
-        await page.goto(test_profile, wait_until="networkidle")
-        await asyncio.sleep(3)
+        await page.goto(test_profile, wait_until="domcontentloaded")
+        try:
+            # Wait on every known selector, so a miss on the first one still
+            # leaves the fallbacks in the lookup below a chance
+            await page.wait_for_selector(MORE_BUTTON_SELECTOR, timeout=15000)
+        except Exception:
+            pass  # the lookup below reports the missing button
         print("✅ Page loaded")
         print()
         
-        # Take screenshot
-        await page.screenshot(path="before_click.png")
-        print("📸 Screenshot saved: before_click.png")
-        print()
+        # Step screenshots are opt-in; failures are always captured below
+        if DEBUG_SHOTS:
+            await page.screenshot(path="before_click.png")
+            print("📸 Screenshot saved: before_click.png")
+            print()
         
         # Look for More button
         print("Looking for 'More' button...")
         print()
         
-        # Try to find it
-        more_button = await page.query_selector('button[aria-label="More actions"]')
-        if not more_button:
-            print("❌ 'More actions' button not found")
-            print("Trying alternative selectors...")
-            
-            # Try other selectors
-            alt_selectors = [
-                'button:has-text("More")',
-                'button[aria-label*="More"]',
-                '.pvs-profile-actions button',
-            ]
-            
-            for selector in alt_selectors:
-                more_button = await page.query_selector(selector)
-                if more_button:
-                    print(f"✅ Found with: {selector}")
-                    break
-        else:
+        # Try all known selectors in a single DOM query
+        try:
+            more_button = await page.locator(MORE_BUTTON_SELECTOR).first.element_handle(timeout=5000)
             print("✅ Found 'More actions' button")
+        except Exception:
+            more_button = None
         
         if not more_button:
             print("❌ Could not find More button at all")
-            await browser.close()
             return False
         
         print()
         print("Clicking 'More' button...")
         await more_button.click()
-        await asyncio.sleep(2)
+        try:
+            # Resolves as soon as the menu renders instead of a fixed sleep
+            await page.wait_for_selector(SELECTORS["save_to_pdf"], state="visible", timeout=10000)
+        except Exception:
+            pass  # the 'Save to PDF' click below reports a missing option
         print("✅ Clicked")
         print()
         
         # Take screenshot of menu
-        await page.screenshot(path="after_more_click.png")
-        print("📸 Screenshot saved: after_more_click.png")
-        print()
+        if DEBUG_SHOTS:
+            await page.screenshot(path="after_more_click.png")
+            print("📸 Screenshot saved: after_more_click.png")
+            print()
         
         # Now set up download listener and click "Save to PDF"
         print("Setting up download listener...")
@@ -121,44 +141,31 @@ async def test_pdf_download_debug():
             download = await download_info.value
             print(f"✅ Download started: {download.suggested_filename}")
             
-            # Get download path
-            download_path = await download.path()
-            print(f"✅ Download path: {download_path}")
-            
-            # Read the PDF
-            with open(download_path, 'rb') as f:
-                pdf_bytes = f.read()
-            
-            # Save it
+            # Let Playwright copy the file straight to its destination
             output_file = "linkedin_profile_real.pdf"
-            with open(output_file, 'wb') as f:
-                f.write(pdf_bytes)
+            await download.save_as(output_file)
+            pdf_size = os.path.getsize(output_file)
             
             print()
             print("=" * 70)
             print("✅ SUCCESS!")
             print("=" * 70)
-            print(f"PDF Size: {len(pdf_bytes):,} bytes")
+            print(f"PDF Size: {pdf_size:,} bytes")
             print(f"Saved to: {output_file}")
             print()
             print("This is LinkedIn's professionally formatted PDF!")
             print("Open it to verify the clean layout and formatting.")
             
-            await browser.close()
             return True
             
         except Exception as e:
             print(f"❌ Download failed: {e}")
             await page.screenshot(path="error_state.png")
             print("📸 Error screenshot saved: error_state.png")
-            await browser.close()
             return False
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    
+    finally:
+        await context.close()
 
 
 if __name__ == "__main__":
@@ -10,8 +10,11 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from alumni_system.scraper.config import HEADLESS_MODE, SLOW_MO
 from alumni_system.scraper.linkedin_scraper import LinkedInScraper
 
+from _playwright_pool import check_cookies, shared_browser
+
 
 async def test_scraper():
     """Test scraper with debug output"""
@@ -29,8 +32,8 @@ async def test_scraper():
     print()
     
     # Check if cookies file exists
-    if not Path(cookies_file).exists():
-        print(f"❌ Cookies file not found: {cookies_file}")
+    if check_cookies(cookies_file) is None:
+        print(f"❌ Cookies file not found or empty: {cookies_file}")
         return
     
     print("✅ Cookies file found")
@@ -38,7 +41,10 @@ async def test_scraper():
     
     # Initialize scraper
     print("Initializing scraper...")
-    async with LinkedInScraper(cookies_file=cookies_file) as scraper:
+    async with (
+        shared_browser(headless=HEADLESS_MODE, slow_mo=SLOW_MO) as browser,
+        LinkedInScraper(cookies_file=cookies_file, cookies=Path(cookies_file).read_bytes(), browser=browser) as scraper,
+    ):
         print("✅ Scraper initialized")
         print()
         
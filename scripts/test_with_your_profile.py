@@ -2,6 +2,9 @@
 """
 Test scraper with your LinkedIn profile
 https://www.linkedin.com/in/im45145v
+
+Pass more profile URLs on the command line to test several at once; each
+profile gets its own browser context on one shared browser.
 """
 
 import asyncio
@@ -10,106 +13,130 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from alumni_system.scraper.config import HEADLESS_MODE, SLOW_MO
 from alumni_system.scraper.linkedin_scraper import LinkedInScraper
 
+from _playwright_pool import check_cookies, shared_browser
+
+# Contexts running at the same time (one logged-in session each)
+MAX_CONTEXTS = 4
+
+
+async def _scrape_one(browser, cookies_file: str, cookies: bytes, url: str, output_file: str, sem: asyncio.Semaphore) -> bool:
+    """Scrape one profile and download its PDF in a dedicated context."""
+    async with sem:
+        async with LinkedInScraper(cookies_file=cookies_file, cookies=cookies, browser=browser) as scraper:
+            print(f"[{url}] Logging in...")
+            if not await scraper.login():
+                print(f"[{url}] ❌ Login failed")
+                return False
+
+            print(f"[{url}] Scraping profile...")
+            profile_data = await scraper.scrape_profile(url)
+
+            if not profile_data:
+                print(f"[{url}] ❌ Failed to scrape profile")
+                return False
+
+            lines = [f"[{url}] ✅ Profile scraped successfully!", "Extracted data:", "-" * 70]
+
+            if profile_data.get('name'):
+                lines.append(f"Name: {profile_data['name']}")
+            if profile_data.get('headline'):
+                lines.append(f"Headline: {profile_data['headline']}")
+            if profile_data.get('location'):
+                lines.append(f"Location: {profile_data['location']}")
+            if profile_data.get('current_company'):
+                lines.append(f"Company: {profile_data['current_company']}")
+            if profile_data.get('current_designation'):
+                lines.append(f"Designation: {profile_data['current_designation']}")
+
+            if profile_data.get('job_history'):
+                lines.append(f"\nJob History: {len(profile_data['job_history'])} positions")
+                for i, job in enumerate(profile_data['job_history'][:3], 1):
+                    lines.append(f"  {i}. {job.get('designation', 'N/A')} at {job.get('company_name', 'N/A')}")
+
+            if profile_data.get('education_history'):
+                lines.append(f"\nEducation: {len(profile_data['education_history'])} entries")
+                for i, edu in enumerate(profile_data['education_history'][:2], 1):
+                    lines.append(f"  {i}. {edu.get('institution_name', 'N/A')}")
+
+            # One print per profile so concurrent output does not interleave
+            print("\n".join(lines))
+            print()
+
+            print(f"[{url}] Testing PDF download...")
+            pdf_bytes = await scraper.download_profile_pdf(url)
+
+            if not pdf_bytes:
+                print(f"[{url}] ❌ PDF download failed")
+                return False
+
+            with open(output_file, "wb") as f:
+                f.write(pdf_bytes)
+
+            print(f"[{url}] ✅ PDF downloaded ({len(pdf_bytes)} bytes), saved to: {output_file}")
+            return True
+
+
+async def test_your_profile(profile_urls: list[str] | None = None, max_contexts: int = MAX_CONTEXTS):
+    """Test scraping your profile (or several profiles concurrently)"""
 
-async def test_your_profile():
-    """Test scraping your profile"""
-    
     print("=" * 70)
     print("Testing Scraper with Your Profile")
     print("=" * 70)
     print()
-    
+
     cookies_file = "cookies/linkedin_cookies_1_fixed.json"
-    your_profile = "https://www.linkedin.com/in/im45145v"
-    
+    profile_urls = profile_urls or ["https://www.linkedin.com/in/im45145v"]
+
     # Check if cookies exist
-    if not Path(cookies_file).exists():
-        print(f"❌ Cookies file not found: {cookies_file}")
+    if check_cookies(cookies_file) is None:
+        print(f"❌ Cookies file not found or empty: {cookies_file}")
         print()
         print("Run this first:")
         print("  python3 scripts/manual_login_and_save.py")
         return
-    
+
     print(f"✅ Cookies file found: {cookies_file}")
-    print(f"✅ Profile URL: {your_profile}")
+    for url in profile_urls:
+        print(f"✅ Profile URL: {url}")
     print()
-    
+
+    # Keep the original output name for the single-profile case
+    if len(profile_urls) == 1:
+        output_files = ["test_your_profile.pdf"]
+    else:
+        output_files = [f"test_{url.rstrip('/').rsplit('/', 1)[-1]}.pdf" for url in profile_urls]
+
     try:
-        async with LinkedInScraper(cookies_file=cookies_file) as scraper:
-            print("Logging in...")
-            if not await scraper.login():
-                print("❌ Login failed")
-                return
-            
-            print("✅ Logged in")
+        cookies = Path(cookies_file).read_bytes()
+        sem = asyncio.Semaphore(max_contexts)
+
+        async with shared_browser(headless=HEADLESS_MODE, slow_mo=SLOW_MO) as browser:
+            results = await asyncio.gather(
+                *[
+                    _scrape_one(browser, cookies_file, cookies, url, output_file, sem)
+                    for url, output_file in zip(profile_urls, output_files)
+                ],
+                return_exceptions=True,
+            )
+
+        for url, result in zip(profile_urls, results):
+            if isinstance(result, Exception):
+                print(f"❌ Error for {url}: {result}")
+
+        if all(result is True for result in results):
             print()
-            
-            print("Scraping your profile...")
-            profile_data = await scraper.scrape_profile(your_profile)
-            
-            if profile_data:
-                print("✅ Profile scraped successfully!")
-                print()
-                print("Extracted data:")
-                print("-" * 70)
-                
-                if profile_data.get('name'):
-                    print(f"Name: {profile_data['name']}")
-                if profile_data.get('headline'):
-                    print(f"Headline: {profile_data['headline']}")
-                if profile_data.get('location'):
-                    print(f"Location: {profile_data['location']}")
-                if profile_data.get('current_company'):
-                    print(f"Company: {profile_data['current_company']}")
-                if profile_data.get('current_designation'):
-                    print(f"Designation: {profile_data['current_designation']}")
-                
-                if profile_data.get('job_history'):
-                    print(f"\nJob History: {len(profile_data['job_history'])} positions")
-                    for i, job in enumerate(profile_data['job_history'][:3], 1):
-                        print(f"  {i}. {job.get('designation', 'N/A')} at {job.get('company_name', 'N/A')}")
-                
-                if profile_data.get('education_history'):
-                    print(f"\nEducation: {len(profile_data['education_history'])} entries")
-                    for i, edu in enumerate(profile_data['education_history'][:2], 1):
-                        print(f"  {i}. {edu.get('institution_name', 'N/A')}")
-                
-                print()
-                print("=" * 70)
-                print("✅ Scraper is working!")
-                print("=" * 70)
-                print()
-                print("Now testing PDF download...")
-                print()
-                
-                # Test PDF download
-                pdf_bytes = await scraper.download_profile_pdf(your_profile)
-                
-                if pdf_bytes:
-                    print(f"✅ PDF downloaded! Size: {len(pdf_bytes)} bytes")
-                    
-                    # Save to file
-                    output_file = "test_your_profile.pdf"
-                    with open(output_file, "wb") as f:
-                        f.write(pdf_bytes)
-                    
-                    print(f"✅ Saved to: {output_file}")
-                    print()
-                    print("=" * 70)
-                    print("✅ ALL TESTS PASSED!")
-                    print("=" * 70)
-                    print()
-                    print("Your setup is working perfectly!")
-                    print()
-                    print("You can now run the full scraper:")
-                    print("  python3 scripts/comprehensive_scraper.py")
-                else:
-                    print("❌ PDF download failed")
-            else:
-                print("❌ Failed to scrape profile")
-    
+            print("=" * 70)
+            print("✅ ALL TESTS PASSED!")
+            print("=" * 70)
+            print()
+            print("Your setup is working perfectly!")
+            print()
+            print("You can now run the full scraper:")
+            print("  python3 scripts/comprehensive_scraper.py")
+
     except Exception as e:
         print(f"❌ Error: {e}")
         import traceback
@@ -118,5 +145,5 @@ async def test_your_profile():
 
 if __name__ == "__main__":
     print()
-    asyncio.run(test_your_profile())
+    asyncio.run(test_your_profile(sys.argv[1:]))
     print()
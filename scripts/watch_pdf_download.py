@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """
 Interactive script to watch the PDF download process step by step.
-The browser will be visible and pause at each step so you can see what's happening.
+
+Set PW_INTERACTIVE=1 to pause for ENTER between steps, PW_HEADFUL=1 to show
+the browser and PW_SLOW_MO=1000 to slow each action down; without them the
+flow runs straight through, headless, with no artificial delay.
 """
 
 import asyncio
@@ -11,7 +14,28 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from playwright.async_api import async_playwright
+from alumni_system.scraper.config import SELECTORS
+
+from _playwright_pool import check_cookies, shared_browser, storage_state
+
+# Set PW_DEBUG_SHOTS=1 to highlight each element before it is clicked
+DEBUG_SHOTS = os.getenv("PW_DEBUG_SHOTS") == "1"
+
+# Every known "More actions" selector, matched in a single DOM query
+MORE_BUTTON_SELECTOR = (
+    f'{SELECTORS["more_actions_button"]}, '
+    'button.artdeco-dropdown__trigger:has-text("More")'
+)
+
+INTERACTIVE = bool(os.getenv("PW_INTERACTIVE"))
+HEADFUL = os.getenv("PW_HEADFUL", "0") == "1"
+SLOW_MO = int(os.getenv("PW_SLOW_MO", "0"))
+
+
+async def pause(message: str) -> None:
+    """Wait for ENTER in interactive mode without blocking the event loop."""
+    if INTERACTIVE:
+        await asyncio.get_running_loop().run_in_executor(None, input, message)
 
 
 async def watch_pdf_download():
@@ -25,137 +49,131 @@ async def watch_pdf_download():
     print("=" * 70)
     print()
     print("This script will:")
-    print("  • Open a visible browser window")
     print("  • Navigate to the LinkedIn profile")
-    print("  • Pause at each step so you can observe")
     print("  • Show you exactly what the automation is doing")
     print()
+    print(f"Browser: {'visible' if HEADFUL else 'headless'} (PW_HEADFUL=1 to show it)")
+    print(f"Pauses:  {'on' if INTERACTIVE else 'off'} (PW_INTERACTIVE=1 to wait for ENTER)")
+    print(f"Slow-mo: {SLOW_MO} ms (PW_SLOW_MO)")
+    print()
     print(f"Profile: {test_profile}")
     print()
     
-    if not os.path.exists(cookies_file):
-        print(f"❌ Cookies file not found: {cookies_file}")
+    cookies_stat = check_cookies(cookies_file)
+    if cookies_stat is None:
+        print(f"❌ Cookies file not found or empty: {cookies_file}")
         return False
     
-    input("Press ENTER to start...")
+    await pause("Press ENTER to start...")
     print()
     
     try:
-        # Start Playwright with visible browser
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=False,  # Show browser
-            slow_mo=1000,    # Slow down by 1 second per action
-        )
-        
-        context = await browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            accept_downloads=True,
-        )
-        
-        # Load cookies
-        import json
-        with open(cookies_file, 'r') as f:
-            cookies = json.load(f)
-        await context.add_cookies(cookies)
-        print(f"✅ Loaded {len(cookies)} cookies")
-        print()
+        async with shared_browser(headless=not HEADFUL, slow_mo=SLOW_MO) as browser:
+            return await _watch(browser, test_profile, cookies_file, cookies_stat.st_mtime)
         
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+async def _watch(browser, test_profile: str, cookies_file: str, cookies_mtime: float) -> bool:
+    """Step through the Save to PDF flow in a fresh context on the shared browser."""
+    
+    # Cookies are installed with the context via storage_state
+    state = storage_state(cookies_file, cookies_mtime)
+    context = await browser.new_context(
+        viewport={"width": 1920, "height": 1080},
+        accept_downloads=True,
+        storage_state=state,
+    )
+    print(f"✅ Loaded {len(state['cookies'])} cookies")
+    print()
+    
+    try:
         page = await context.new_page()
         
         # Step 1: Navigate
         print("STEP 1: Navigating to profile...")
         print(f"URL: {test_profile}")
-        input("Press ENTER to navigate...")
+        await pause("Press ENTER to navigate...")
         
-        await page.goto(test_profile, wait_until="networkidle")
-        await asyncio.sleep(3)
+        await page.goto(test_profile, wait_until="domcontentloaded")
+        try:
+            # Wait on every known selector, so a miss on the first one still
+            # leaves the fallbacks in the lookup below a chance
+            await page.wait_for_selector(MORE_BUTTON_SELECTOR, timeout=15000)
+        except Exception:
+            pass  # the lookup below reports the missing button
         
         print("✅ Page loaded")
         print()
-        input("Press ENTER to continue...")
+        await pause("Press ENTER to continue...")
         print()
         
         # Step 2: Find More button
         print("STEP 2: Looking for 'More actions' button...")
         print("Watch the browser - the button should be highlighted")
-        input("Press ENTER to search...")
+        await pause("Press ENTER to search...")
         
-        more_button = await page.query_selector('button[aria-label="More actions"]')
-        
-        if not more_button:
-            print("❌ Button not found with first selector")
-            print("Trying alternative selectors...")
-            
-            alt_selectors = [
-                'button.artdeco-dropdown__trigger:has-text("More")',
-                'button[id*="profile-overflow-action"]',
-            ]
-            
-            for selector in alt_selectors:
-                more_button = await page.query_selector(selector)
-                if more_button:
-                    print(f"✅ Found with: {selector}")
-                    break
-        else:
+        # Try all known selectors in a single DOM query
+        try:
+            more_button = await page.locator(MORE_BUTTON_SELECTOR).first.element_handle(timeout=5000)
             print("✅ Found 'More actions' button")
+        except Exception:
+            more_button = None
         
         if not more_button:
             print("❌ Could not find More button")
-            await browser.close()
             return False
         
         # Highlight the button
-        await more_button.evaluate("el => el.style.border = '3px solid red'")
-        print()
-        print("👀 The 'More' button should now have a RED BORDER")
-        print()
-        input("Press ENTER to click it...")
+        if DEBUG_SHOTS:
+            await more_button.evaluate("el => el.style.border = '3px solid red'")
+            print()
+            print("👀 The 'More' button should now have a RED BORDER")
+            print()
+        await pause("Press ENTER to click it...")
         
         # Step 3: Click More button
         print()
         print("STEP 3: Clicking 'More' button...")
         await more_button.click()
-        await asyncio.sleep(2)
+        try:
+            # Resolves as soon as the menu renders instead of a fixed sleep
+            await page.wait_for_selector(SELECTORS["save_to_pdf"], state="visible", timeout=10000)
+        except Exception:
+            pass  # step 4 looks the option up and reports a miss
         print("✅ Clicked - menu should be open now")
         print()
-        input("Press ENTER to continue...")
+        await pause("Press ENTER to continue...")
         print()
         
         # Step 4: Find Save to PDF
         print("STEP 4: Looking for 'Save to PDF' option...")
-        input("Press ENTER to search...")
+        await pause("Press ENTER to search...")
         
-        save_pdf = await page.query_selector('div[aria-label="Save to PDF"][role="button"]')
-        
-        if not save_pdf:
-            print("❌ Not found with first selector")
-            print("Trying alternatives...")
-            
-            alt_selectors = [
-                'div[aria-label="Save to PDF"]',
-                '[aria-label="Save to PDF"]',
-            ]
-            
-            for selector in alt_selectors:
-                save_pdf = await page.query_selector(selector)
-                if save_pdf:
-                    print(f"✅ Found with: {selector}")
-                    break
-        else:
+        # The broadest selector already covers the div/role variants
+        try:
+            save_pdf = await page.locator(
+                f'{SELECTORS["save_to_pdf"]}, [aria-label="Save to PDF"]'
+            ).first.element_handle(timeout=5000)
             print("✅ Found 'Save to PDF' option")
+        except Exception:
+            save_pdf = None
         
         if not save_pdf:
             print("❌ Could not find Save to PDF")
-            await browser.close()
             return False
         
         # Highlight it
-        await save_pdf.evaluate("el => el.style.border = '3px solid green'")
-        print()
-        print("👀 The 'Save to PDF' option should now have a GREEN BORDER")
-        print()
-        input("Press ENTER to click it and start download...")
+        if DEBUG_SHOTS:
+            await save_pdf.evaluate("el => el.style.border = '3px solid green'")
+            print()
+            print("👀 The 'Save to PDF' option should now have a GREEN BORDER")
+            print()
+        await pause("Press ENTER to click it and start download...")
         
         # Step 5: Click and capture download
         print()
@@ -171,30 +189,22 @@ async def watch_pdf_download():
             download = await download_info.value
             print(f"✅ Download started: {download.suggested_filename}")
             
-            download_path = await download.path()
-            print(f"✅ Download path: {download_path}")
-            
-            # Read the PDF
-            with open(download_path, 'rb') as f:
-                pdf_bytes = f.read()
-            
-            # Save it
+            # Let Playwright copy the file straight to its destination
             output_file = "linkedin_profile_watched.pdf"
-            with open(output_file, 'wb') as f:
-                f.write(pdf_bytes)
+            await download.save_as(output_file)
+            pdf_size = os.path.getsize(output_file)
             
             print()
             print("=" * 70)
             print("✅ SUCCESS!")
             print("=" * 70)
-            print(f"PDF Size: {len(pdf_bytes):,} bytes")
+            print(f"PDF Size: {pdf_size:,} bytes")
             print(f"Saved to: {output_file}")
             print()
             print("This is LinkedIn's professionally formatted PDF!")
             print()
             
-            input("Press ENTER to close browser...")
-            await browser.close()
+            await pause("Press ENTER to close browser...")
             return True
             
         except Exception as e:
@@ -205,15 +215,11 @@ async def watch_pdf_download():
             print("  • Download was blocked")
             print("  • Network issue")
             print()
-            input("Press ENTER to close browser...")
-            await browser.close()
+            await pause("Press ENTER to close browser...")
             return False
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    
+    finally:
+        await context.close()
 
 
 if __name__ == "__main__":
@@ -3,12 +3,35 @@
 Quick test to verify all fixes are working
 """
 
+import ast
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+
+def _dotted_name(node: ast.AST) -> str:
+    """Return 'a.b.c' for a Name/Attribute chain, or '' for anything else."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return ""
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+@lru_cache(maxsize=None)
+def _attribute_names(path: Path) -> frozenset:
+    """Parse a source file once and collect every dotted attribute it references."""
+    tree = ast.parse(path.read_text())
+    return frozenset(
+        _dotted_name(node) for node in ast.walk(tree) if isinstance(node, ast.Attribute)
+    )
+
 def test_imports():
     """Test that all imports work"""
     print("Testing imports...")
@@ -25,10 +48,12 @@ def test_database_connection():
     """Test database connection"""
     print("\nTesting database connection...")
     try:
-        from alumni_system.database.connection import get_db_context
+        from alumni_system.database.connection import SessionLocal
         from alumni_system.database.crud import get_alumni_count
         
-        with get_db_context() as db:
+        # SessionLocal is bound to the module-level pooled engine, so checks
+        # share connections; a read-only count needs no commit round-trip
+        with SessionLocal() as db:
             count = get_alumni_count(db)
         
         print(f"✅ Database connected! Found {count} alumni records")
@@ -43,16 +68,16 @@ def test_streamlit_app():
     """Test that Streamlit app can be imported"""
     print("\nTesting Streamlit app...")
     try:
-        # Just check if the file can be read
+        # Inspect the parsed code so comments and strings don't count
         app_path = Path(__file__).parent / "alumni_system" / "frontend" / "app.py"
-        content = app_path.read_text()
+        names = _attribute_names(app_path)
         
         # Check for the fixes
-        if "st.switch_page" in content:
+        if "st.switch_page" in names:
             print("⚠️  Warning: st.switch_page still found in code")
             return False
         
-        if "st.session_state.page" in content and "st.rerun()" in content:
+        if "st.session_state.page" in names and "st.rerun" in names:
             print("✅ Streamlit navigation fix verified")
         else:
             print("⚠️  Warning: Navigation fix not found")
@@ -5,20 +5,181 @@ Test script to scrape the two new alumni LinkedIn profiles
 
 import asyncio
 import json
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from playwright.async_api import async_playwright
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from alumni_system.database.connection import get_db_context
 from alumni_system.database.crud import get_alumni_by_roll_number, update_alumni
+from alumni_system.scraper.config import HEADLESS_MODE, SLOW_MO
 from alumni_system.scraper.linkedin_scraper import LinkedInScraper
 
+# Profiles scraped at the same time; kept low to respect LinkedIn rate limits
+MAX_CONCURRENCY = 3
+
+# Set SCRAPER_VERBOSE=0 to skip the per-profile field dump
+VERBOSE = os.getenv("SCRAPER_VERBOSE", "1") != "0"
+
+# Set SCRAPER_PRETTY_JSON=1 to also write an indented *.pretty.json copy
+PRETTY_JSON = os.getenv("SCRAPER_PRETTY_JSON") == "1"
+
+
+def _write_json(path: str, data: dict, pretty: bool = False) -> None:
+    """Write data as JSON, compact unless pretty is set."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        Path(path).write_bytes(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w') as f:
+            if pretty:
+                json.dump(data, f, indent=2)
+            else:
+                json.dump(data, f, separators=(",", ":"))
+
+
+async def _scrape_one(alumni: dict, scrapers: asyncio.Queue) -> dict:
+    """Scrape one alumni profile with a pooled scraper and save it to JSON."""
+    # Borrow a warm scraper so its context (cookies, open connections) is reused
+    scraper = await scrapers.get()
+    try:
+        profile_data = await scraper.scrape_profile(alumni['linkedin_url'])
+    finally:
+        scrapers.put_nowait(scraper)
+
+    result = {"alumni": alumni, "profile_data": profile_data, "db_status": None}
+    if not profile_data:
+        return result
+
+    # Save full data to JSON; the pretty copy is only for reading by hand
+    output_file = f"scraped_{alumni['roll_number']}.json"
+    _write_json(output_file, profile_data)
+    if PRETTY_JSON:
+        _write_json(f"scraped_{alumni['roll_number']}.pretty.json", profile_data, pretty=True)
+    result["output_file"] = output_file
+
+    # Collect the fields to update; the database is written once for all profiles
+    update_data = {}
+    if "name" in profile_data:
+        update_data["name"] = profile_data["name"]
+    if "headline" in profile_data:
+        update_data["por"] = profile_data["headline"]
+    if "location" in profile_data:
+        update_data["location"] = profile_data["location"]
+    if "current_company" in profile_data:
+        update_data["current_company"] = profile_data["current_company"]
+    if "current_designation" in profile_data:
+        update_data["current_designation"] = profile_data["current_designation"]
+    result["update_data"] = update_data
+
+    return result
+
+
+def _apply_updates(results: list) -> None:
+    """Write all scraped fields to the database over a single session."""
+    pending = [
+        result for result in results
+        if not isinstance(result, Exception) and result["profile_data"]
+    ]
+    if not pending:
+        return
+
+    with get_db_context() as db:
+        for result in pending:
+            alumni_record = get_alumni_by_roll_number(db, result["alumni"]["roll_number"])
+            if not alumni_record:
+                continue
+
+            if result["update_data"]:
+                update_alumni(db, alumni_record.id, **result["update_data"])
+                result["db_status"] = "updated"
+            else:
+                result["db_status"] = "unchanged"
+
+
+def _print_result(alumni: dict, result) -> None:
+    """Print the report for one scraped profile."""
+    print(f"🔍 Scraped: {alumni['name']} ({alumni['roll_number']})")
+    print(f"   LinkedIn: {alumni['linkedin_url']}")
+    print()
+
+    if isinstance(result, Exception):
+        print(f"❌ Error scraping {alumni['name']}: {result}")
+        return
+
+    profile_data = result["profile_data"]
+    if not profile_data:
+        print(f"❌ Failed to scrape profile for {alumni['name']}")
+        return
+
+    lines = ["✅ Successfully scraped profile!"]
+
+    if VERBOSE:
+        lines += ["", "📊 Extracted Data:", "-" * 70]
+
+        # Display basic info
+        if "name" in profile_data:
+            lines.append(f"   Name: {profile_data['name']}")
+        if "headline" in profile_data:
+            lines.append(f"   Headline: {profile_data['headline']}")
+        if "location" in profile_data:
+            lines.append(f"   Location: {profile_data['location']}")
+        if "current_company" in profile_data:
+            lines.append(f"   Current Company: {profile_data['current_company']}")
+        if "current_designation" in profile_data:
+            lines.append(f"   Current Designation: {profile_data['current_designation']}")
+
+        # Display job history
+        if "job_history" in profile_data and profile_data["job_history"]:
+            lines.append(f"\n   📋 Job History ({len(profile_data['job_history'])} positions):")
+            for i, job in enumerate(profile_data["job_history"][:5], 1):
+                lines.append(f"      {i}. {job.get('designation', 'N/A')} at {job.get('company_name', 'N/A')}")
+                if "duration" in job:
+                    lines.append(f"         Duration: {job['duration']}")
 
-async def test_scrape_alumni():
+        # Display education
+        if "education_history" in profile_data and profile_data["education_history"]:
+            lines.append(f"\n   🎓 Education ({len(profile_data['education_history'])} entries):")
+            for i, edu in enumerate(profile_data["education_history"][:3], 1):
+                lines.append(f"      {i}. {edu.get('institution_name', 'N/A')}")
+                if "degree" in edu:
+                    lines.append(f"         Degree: {edu['degree']}")
+
+        # Display contact info
+        if "email" in profile_data:
+            lines.append(f"\n   📧 Email: {profile_data['email']}")
+
+        lines += ["", "-" * 70]
+
+    lines += ["", f"💾 Full data saved to: {result['output_file']}"]
+
+    if result["db_status"] == "updated":
+        lines.append(f"✅ Database updated for {alumni['name']}")
+    elif result["db_status"] == "unchanged":
+        lines.append(f"⚠️  No new data to update for {alumni['name']}")
+
+    # One write per profile instead of one per line
+    print("\n".join(lines))
+
+async def test_scrape_alumni(max_concurrency: int = MAX_CONCURRENCY):
     """Test scraping both alumni profiles"""
-    
+
     # Alumni to scrape
     alumni_to_scrape = [
         {
@@ -32,125 +193,73 @@ async def test_scrape_alumni():
             "linkedin_url": "http://linkedin.com/in/narendrant1998"
         }
     ]
-    
+
     print("=" * 70)
     print("LinkedIn Scraper Test")
     print("=" * 70)
     print()
-    
+
     # Initialize scraper with cookies
     cookies_file = "cookies/linkedin_cookies_1.json"
-    
-    async with LinkedInScraper(cookies_file=cookies_file) as scraper:
-        print(f"✅ Scraper initialized with cookies from: {cookies_file}")
-        print()
-        
-        # Verify authentication
-        print("🔐 Verifying cookie authentication...")
-        if await scraper.verify_cookie_auth():
-            print("✅ Authentication successful!")
-        else:
-            print("❌ Authentication failed!")
-            print("Please check your cookies file or try logging in manually.")
-            return
-        
-        print()
-        print("=" * 70)
-        print()
-        
-        # Scrape each alumni
-        for alumni in alumni_to_scrape:
-            print(f"🔍 Scraping: {alumni['name']} ({alumni['roll_number']})")
-            print(f"   LinkedIn: {alumni['linkedin_url']}")
+    cookies = Path(cookies_file).read_bytes()
+
+    async with async_playwright() as playwright:
+        # One browser for all profiles
+        browser = await playwright.chromium.launch(headless=HEADLESS_MODE, slow_mo=SLOW_MO)
+
+        # A fixed pool of scrapers (one context each) shared by all profiles;
+        # the queue also caps how many profiles are scraped at once
+        pool = [
+            LinkedInScraper(cookies_file=cookies_file, cookies=cookies, browser=browser)
+            for _ in range(min(max_concurrency, len(alumni_to_scrape)))
+        ]
+        scrapers: asyncio.Queue = asyncio.Queue()
+        for scraper in pool:
+            await scraper.start()
+            scrapers.put_nowait(scraper)
+
+        try:
+            print(f"✅ Scraper initialized with cookies from: {cookies_file}")
             print()
-            
-            try:
-                # Scrape the profile
-                profile_data = await scraper.scrape_profile(alumni['linkedin_url'])
-                
-                if profile_data:
-                    print("✅ Successfully scraped profile!")
-                    print()
-                    print("📊 Extracted Data:")
-                    print("-" * 70)
-                    
-                    # Display basic info
-                    if "name" in profile_data:
-                        print(f"   Name: {profile_data['name']}")
-                    if "headline" in profile_data:
-                        print(f"   Headline: {profile_data['headline']}")
-                    if "location" in profile_data:
-                        print(f"   Location: {profile_data['location']}")
-                    if "current_company" in profile_data:
-                        print(f"   Current Company: {profile_data['current_company']}")
-                    if "current_designation" in profile_data:
-                        print(f"   Current Designation: {profile_data['current_designation']}")
-                    
-                    # Display job history
-                    if "job_history" in profile_data and profile_data["job_history"]:
-                        print(f"\n   📋 Job History ({len(profile_data['job_history'])} positions):")
-                        for i, job in enumerate(profile_data["job_history"][:5], 1):
-                            print(f"      {i}. {job.get('designation', 'N/A')} at {job.get('company_name', 'N/A')}")
-                            if "duration" in job:
-                                print(f"         Duration: {job['duration']}")
-                    
-                    # Display education
-                    if "education_history" in profile_data and profile_data["education_history"]:
-                        print(f"\n   🎓 Education ({len(profile_data['education_history'])} entries):")
-                        for i, edu in enumerate(profile_data["education_history"][:3], 1):
-                            print(f"      {i}. {edu.get('institution_name', 'N/A')}")
-                            if "degree" in edu:
-                                print(f"         Degree: {edu['degree']}")
-                    
-                    # Display contact info
-                    if "email" in profile_data:
-                        print(f"\n   📧 Email: {profile_data['email']}")
-                    
-                    print()
-                    print("-" * 70)
-                    print()
-                    
-                    # Save full data to JSON for inspection
-                    output_file = f"scraped_{alumni['roll_number']}.json"
-                    with open(output_file, 'w') as f:
-                        json.dump(profile_data, f, indent=2)
-                    print(f"💾 Full data saved to: {output_file}")
-                    print()
-                    
-                    # Update database
-                    print("💾 Updating database...")
-                    with get_db_context() as db:
-                        alumni_record = get_alumni_by_roll_number(db, alumni['roll_number'])
-                        if alumni_record:
-                            update_data = {}
-                            
-                            if "name" in profile_data:
-                                update_data["name"] = profile_data["name"]
-                            if "headline" in profile_data:
-                                update_data["por"] = profile_data["headline"]
-                            if "location" in profile_data:
-                                update_data["location"] = profile_data["location"]
-                            if "current_company" in profile_data:
-                                update_data["current_company"] = profile_data["current_company"]
-                            if "current_designation" in profile_data:
-                                update_data["current_designation"] = profile_data["current_designation"]
-                            
-                            if update_data:
-                                update_alumni(db, alumni_record.id, **update_data)
-                                print(f"✅ Database updated for {alumni['name']}")
-                            else:
-                                print(f"⚠️  No new data to update for {alumni['name']}")
-                    
-                else:
-                    print(f"❌ Failed to scrape profile for {alumni['name']}")
-                
-            except Exception as e:
-                print(f"❌ Error scraping {alumni['name']}: {e}")
-            
+
+            # Verify authentication
+            print("🔐 Verifying cookie authentication...")
+            if await pool[0].verify_cookie_auth():
+                print("✅ Authentication successful!")
+            else:
+                print("❌ Authentication failed!")
+                print("Please check your cookies file or try logging in manually.")
+                return
+
             print()
             print("=" * 70)
             print()
-    
+
+            # Scrape all alumni concurrently
+            print(f"🔍 Scraping {len(alumni_to_scrape)} profiles (up to {len(pool)} at a time)...")
+            print()
+            results = await asyncio.gather(
+                *[_scrape_one(alumni, scrapers) for alumni in alumni_to_scrape],
+                return_exceptions=True,
+            )
+        finally:
+            for scraper in pool:
+                await scraper.close()
+            await browser.close()
+
+    try:
+        _apply_updates(results)
+    except Exception as e:
+        print(f"❌ Database update failed: {e}")
+        print()
+
+    # Report once all scrapes have finished so output does not interleave
+    for alumni, result in zip(alumni_to_scrape, results):
+        _print_result(alumni, result)
+        print()
+        print("=" * 70)
+        print()
+
     print("✨ Scraping test complete!")
     print()
     print("📁 Check the generated JSON files for full scraped data:")
@@ -160,4 +269,7 @@ async def test_scrape_alumni():
 
 if __name__ == "__main__":
     print()
+    if UVLOOP_AVAILABLE:
+        # libuv-backed loop: cheaper socket polling and task switches
+        uvloop.install()
     asyncio.run(test_scrape_alumni())
@@ -3,24 +3,74 @@ Pytest configuration and fixtures for testing.
 """
 
 import os
-from typing import Generator
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Generator
 
 import pytest
-from sqlalchemy import create_engine
+from hypothesis import HealthCheck, settings
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import Session, sessionmaker
 
 from alumni_system.database.models import Base
 
 
+# Hypothesis profiles: "ci" (default) runs fewer, reproducible examples and
+# never touches the on-disk example database; "dev" keeps the full example
+# count and the database. Select with HYPOTHESIS_PROFILE=dev. Both allow
+# function-scoped fixtures such as db_session, which are shared by all
+# examples of a test rather than re-created per example, and neither sets a
+# deadline: database round trips make example timings too noisy for one.
+_FIXTURE_CHECKS = [HealthCheck.function_scoped_fixture]
+settings.register_profile(
+    "ci",
+    max_examples=25,
+    derandomize=True,
+    deadline=None,
+    database=None,
+    suppress_health_check=_FIXTURE_CHECKS,
+)
+settings.register_profile(
+    "dev",
+    max_examples=100,
+    deadline=None,
+    suppress_health_check=_FIXTURE_CHECKS,
+)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci"))
+
+# Child tables first, so rows can be deleted without breaking foreign keys
+_TABLES_REVERSED = list(reversed(Base.metadata.sorted_tables))
+
+
 @pytest.fixture(scope="session")
 def test_db_engine():
     """
     Create a test database engine.
     
-    Uses an in-memory SQLite database for fast, isolated testing.
+    Uses an in-memory SQLite database for fast, isolated testing. Under
+    pytest-xdist every worker is its own process, so each worker gets a
+    private database with no per-worker naming or teardown needed.
     """
-    # Use in-memory SQLite for testing
-    engine = create_engine("sqlite:///:memory:", echo=False)
+    # Use in-memory SQLite for testing. StaticPool hands every checkout the
+    # same connection, so the schema survives and connects are free.
+    engine = create_engine(
+        "sqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite.
+    # Keep sort/temp b-trees in RAM too; an in-memory database already has
+    # no fsync or on-disk journal, so synchronous/journal_mode are moot.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        dbapi_connection.execute("PRAGMA temp_store=MEMORY")
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
     
     # Create all tables
     Base.metadata.create_all(bind=engine)
@@ -32,26 +82,60 @@ def test_db_engine():
     engine.dispose()
 
 
-@pytest.fixture(scope="function")
-def db_session(test_db_engine) -> Generator[Session, None, None]:
+@pytest.fixture(scope="session")
+def db_connection(test_db_engine):
     """
-    Create a new database session for a test.
-    
-    Each test gets a fresh session that is rolled back after the test completes.
+    Open one connection that every db_session test runs on.
     """
     connection = test_db_engine.connect()
-    transaction = connection.begin()
     
-    SessionLocal = sessionmaker(bind=connection)
-    session = SessionLocal()
+    yield connection
     
-    yield session
-    
-    session.close()
-    transaction.rollback()
     connection.close()
 
 
+@contextmanager
+def _rollback_session(connection) -> Generator[Session, None, None]:
+    """
+    Yield a session whose work is rolled back on exit.
+    
+    The session runs inside a transaction on the shared connection and works
+    in a SAVEPOINT, so commits made by the code under test only release the
+    savepoint.
+    """
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+
+
+@pytest.fixture(scope="function")
+def db_session(db_connection) -> Generator[Session, None, None]:
+    """
+    Create a new database session for a test.
+    
+    Everything the test writes is rolled back after the test completes.
+    """
+    with _rollback_session(db_connection) as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
+def isolated_db_session(db_connection) -> Callable[[], ContextManager[Session]]:
+    """
+    Factory for per-example sessions in Hypothesis tests.
+    
+    A function-scoped db_session is set up once per test, not once per
+    @given example, so examples would see each other's rows. Use
+    ``with isolated_db_session() as db_session:`` in the test body instead;
+    each example's writes are rolled back when the block exits.
+    """
+    return lambda: _rollback_session(db_connection)
+
+
 @pytest.fixture(scope="function")
 def clean_db_session(test_db_engine) -> Generator[Session, None, None]:
     """
@@ -67,7 +151,7 @@ def clean_db_session(test_db_engine) -> Generator[Session, None, None]:
     
     # Clean up all data after test to maintain isolation
     try:
-        for table in reversed(Base.metadata.sorted_tables):
+        for table in _TABLES_REVERSED:
             session.execute(table.delete())
         session.commit()
     except Exception:
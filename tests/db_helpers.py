@@ -0,0 +1,84 @@
+"""
+Insert helpers for test setup.
+
+Creating rows through the CRUD helpers costs a lookup (for alumni upserts),
+an INSERT, a commit and a refresh per row. These helpers only insert, a
+whole batch with one executemany where they can, and do not commit: the
+rows are visible to later queries on the same session, and the db_session
+fixtures roll everything back anyway.
+"""
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from alumni_system.database.models import Alumni, EducationHistory, JobHistory
+
+
+def insert_alumni(db: Session, **kwargs) -> Alumni:
+    """
+    Insert one new alumni record.
+
+    Unlike create_alumni(), there is no lookup by roll number first and no
+    commit or refresh afterwards; a flush sends the INSERT and fills in the
+    id. The roll number must not be in the database yet.
+
+    Args:
+        db: Database session.
+        **kwargs: Alumni field values.
+
+    Returns:
+        The new Alumni object.
+    """
+    alumni = Alumni(**kwargs)
+    db.add(alumni)
+    db.flush()
+    return alumni
+
+
+def bulk_create_alumni(db: Session, rows: list[dict]) -> None:
+    """
+    Insert new alumni records in one batch.
+
+    Unlike create_alumni(), existing roll numbers are not updated in place,
+    so every row must have a roll number that is not in the database yet.
+
+    Args:
+        db: Database session.
+        rows: Alumni field values, one dict per record.
+    """
+    if rows:
+        db.execute(insert(Alumni), rows)
+
+
+def bulk_create_job_history(db: Session, alumni_id: int, jobs: list[dict]) -> list[dict]:
+    """
+    Insert job history records for an alumni in one batch.
+
+    Args:
+        db: Database session.
+        alumni_id: Alumni ID the records belong to.
+        jobs: JobHistory field values, one dict per record.
+
+    Returns:
+        The inserted rows as dicts, each including its generated "id".
+    """
+    rows = [{**job, "alumni_id": alumni_id} for job in jobs]
+    db.bulk_insert_mappings(JobHistory, rows, return_defaults=True)
+    return rows
+
+
+def bulk_create_education_history(db: Session, alumni_id: int, education: list[dict]) -> list[dict]:
+    """
+    Insert education history records for an alumni in one batch.
+
+    Args:
+        db: Database session.
+        alumni_id: Alumni ID the records belong to.
+        education: EducationHistory field values, one dict per record.
+
+    Returns:
+        The inserted rows as dicts, each including its generated "id".
+    """
+    rows = [{**edu, "alumni_id": alumni_id} for edu in education]
+    db.bulk_insert_mappings(EducationHistory, rows, return_defaults=True)
+    return rows
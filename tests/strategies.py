@@ -0,0 +1,22 @@
+"""
+Shared Hypothesis strategies for the property-based tests.
+
+Strategies are built once at import, so every test module that draws alumni
+records reuses the same strategy objects.
+"""
+
+from hypothesis import strategies as st
+
+ROLL_NUMBER_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+TEXT_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '
+DIGITS = '0123456789'
+
+# Random alumni data; fixed_dictionaries avoids the overhead of a composite
+ALUMNI_STRATEGY = st.fixed_dictionaries({
+    'roll_number': st.text(min_size=5, max_size=20, alphabet=ROLL_NUMBER_ALPHABET),
+    'name': st.text(min_size=3, max_size=50, alphabet=TEXT_ALPHABET),
+    'batch': st.text(min_size=4, max_size=10, alphabet=DIGITS),
+    'current_company': st.text(min_size=3, max_size=50, alphabet=TEXT_ALPHABET),
+    'current_designation': st.text(min_size=3, max_size=50, alphabet=TEXT_ALPHABET),
+    'location': st.text(min_size=3, max_size=50, alphabet=TEXT_ALPHABET),
+})
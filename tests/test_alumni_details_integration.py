@@ -7,50 +7,70 @@ Tests the complete alumni details page workflow including:
 - Calculating summary statistics
 - Displaying education history
 - Showing PDF download link
+
+Tests that only check the created rows assert on the objects returned by
+create_*(). The tests that seed rows in bulk (displays_all_job_history,
+calculates_summary_statistics, displays_education_history and
+complete_workflow) read back through the CRUD getters on purpose; they cover
+the detail view's read path, including ordering and eager loading.
 """
 
-import uuid
+import itertools
 from datetime import datetime, timedelta
 
 import pytest
 
 from alumni_system.database.crud import (
     create_alumni,
-    create_education_history,
     create_job_history,
     get_alumni_by_id,
+    get_alumni_detail,
     get_education_history_by_alumni,
     get_job_history_by_alumni,
 )
+from tests.db_helpers import bulk_create_education_history, bulk_create_job_history
+
+DAY = timedelta(days=1)
+
+# Unique 20-character roll numbers for this process
+_ROLL_COUNTER = itertools.count()
+
+_ALUMNI_TEMPLATE = {"name": "Test Alumni", "batch": "2020"}
+
+
+def _make_alumni(db_session, **overrides):
+    """Create an alumni from the template with a fresh roll number."""
+    return create_alumni(
+        db_session,
+        roll_number=f"R{next(_ROLL_COUNTER):019d}",
+        **{**_ALUMNI_TEMPLATE, **overrides},
+    )
 
 
 def test_alumni_details_displays_all_job_history(db_session):
     """Test that alumni details page displays all job history records."""
+    now = datetime.now()
+    
     # Create alumni
-    alumni = create_alumni(
+    alumni = _make_alumni(
         db_session,
-        roll_number=str(uuid.uuid4())[:20],
-        name="Test Alumni",
-        batch="2020",
         current_company="Google",
         current_designation="Software Engineer",
     )
     
     # Create multiple job history records
-    jobs = []
-    for i in range(5):
-        job = create_job_history(
-            db_session,
-            alumni_id=alumni.id,
+    bulk_create_job_history(db_session, alumni.id, [
+        dict(
             company_name=f"Company {i}",
             designation=f"Role {i}",
             location="Bangalore",
-            start_date=datetime.now() - timedelta(days=365 * (5 - i)),
-            end_date=datetime.now() - timedelta(days=365 * (4 - i)) if i < 4 else None,
+            start_date=now - 365 * (5 - i) * DAY,
+            end_date=now - 365 * (4 - i) * DAY if i < 4 else None,
             is_current=(i == 4),
             employment_type="Full-time",
         )
-        jobs.append(job)
+        for i in range(5)
+    ])
     
     # Fetch job history (simulating what the detail view does)
     fetched_jobs = get_job_history_by_alumni(db_session, alumni.id)
@@ -65,22 +85,19 @@ def test_alumni_details_displays_all_job_history(db_session):
 
 def test_alumni_details_indicates_current_position(db_session):
     """Test that current position is properly indicated in job history."""
+    now = datetime.now()
+    
     # Create alumni
-    alumni = create_alumni(
-        db_session,
-        roll_number=str(uuid.uuid4())[:20],
-        name="Test Alumni",
-        batch="2020",
-    )
+    alumni = _make_alumni(db_session)
     
     # Create job history with one current position
-    create_job_history(
+    old_job = create_job_history(
         db_session,
         alumni_id=alumni.id,
         company_name="Old Company",
         designation="Junior Engineer",
-        start_date=datetime.now() - timedelta(days=730),
-        end_date=datetime.now() - timedelta(days=365),
+        start_date=now - 730 * DAY,
+        end_date=now - 365 * DAY,
         is_current=False,
         employment_type="Full-time",
     )
@@ -90,17 +107,14 @@ def test_alumni_details_indicates_current_position(db_session):
         alumni_id=alumni.id,
         company_name="Current Company",
         designation="Senior Engineer",
-        start_date=datetime.now() - timedelta(days=365),
+        start_date=now - 365 * DAY,
         end_date=None,
         is_current=True,
         employment_type="Full-time",
     )
     
-    # Fetch job history
-    fetched_jobs = get_job_history_by_alumni(db_session, alumni.id)
-    
     # Verify current position is identifiable
-    current_positions = [job for job in fetched_jobs if job.is_current]
+    current_positions = [job for job in (old_job, current_job) if job.is_current]
     assert len(current_positions) == 1
     assert current_positions[0].id == current_job.id
     assert current_positions[0].end_date is None
@@ -108,34 +122,31 @@ def test_alumni_details_indicates_current_position(db_session):
 
 def test_alumni_details_calculates_summary_statistics(db_session):
     """Test that summary statistics are correctly calculated."""
+    now = datetime.now()
+    
     # Create alumni
-    alumni = create_alumni(
-        db_session,
-        roll_number=str(uuid.uuid4())[:20],
-        name="Test Alumni",
-        batch="2020",
-    )
+    alumni = _make_alumni(db_session)
     
     # Create job history at multiple companies
     companies = ["Google", "Microsoft", "Google", "Amazon", "Microsoft"]
-    for i, company in enumerate(companies):
-        create_job_history(
-            db_session,
-            alumni_id=alumni.id,
+    bulk_create_job_history(db_session, alumni.id, [
+        dict(
             company_name=company,
             designation=f"Role {i}",
-            start_date=datetime.now() - timedelta(days=365 * (5 - i)),
-            end_date=datetime.now() - timedelta(days=365 * (4 - i)) if i < 4 else None,
+            start_date=now - 365 * (5 - i) * DAY,
+            end_date=now - 365 * (4 - i) * DAY if i < 4 else None,
             is_current=(i == 4),
             employment_type="Full-time",
         )
+        for i, company in enumerate(companies)
+    ])
     
     # Fetch job history
     fetched_jobs = get_job_history_by_alumni(db_session, alumni.id)
     
     # Calculate statistics (as the detail view would)
     total_positions = len(fetched_jobs)
-    unique_companies = len(set(job.company_name for job in fetched_jobs))
+    unique_companies = len({job.company_name for job in fetched_jobs})
     
     # Verify statistics
     assert total_positions == 5, "Should have 5 total positions"
@@ -145,19 +156,11 @@ def test_alumni_details_calculates_summary_statistics(db_session):
 def test_alumni_details_displays_education_history(db_session):
     """Test that education history is displayed."""
     # Create alumni
-    alumni = create_alumni(
-        db_session,
-        roll_number=str(uuid.uuid4())[:20],
-        name="Test Alumni",
-        batch="2020",
-    )
+    alumni = _make_alumni(db_session)
     
     # Create education history records
-    education_records = []
-    for i in range(3):
-        edu = create_education_history(
-            db_session,
-            alumni_id=alumni.id,
+    bulk_create_education_history(db_session, alumni.id, [
+        dict(
             institution_name=f"University {i}",
             degree="B.Tech" if i == 0 else "M.Tech",
             field_of_study="Computer Science",
@@ -165,7 +168,8 @@ def test_alumni_details_displays_education_history(db_session):
             end_year=2019 + i * 4,
             grade="A",
         )
-        education_records.append(edu)
+        for i in range(3)
+    ])
     
     # Fetch education history
     fetched_education = get_education_history_by_alumni(db_session, alumni.id)
@@ -177,20 +181,16 @@ def test_alumni_details_displays_education_history(db_session):
 def test_alumni_details_shows_pdf_link_when_available(db_session):
     """Test that PDF download link is shown when available."""
     # Create alumni with PDF URL
-    alumni_with_pdf = create_alumni(
+    alumni_with_pdf = _make_alumni(
         db_session,
-        roll_number=str(uuid.uuid4())[:20],
         name="Alumni With PDF",
-        batch="2020",
         linkedin_pdf_url="https://example.com/pdfs/alumni_123.pdf",
     )
     
     # Create alumni without PDF URL
-    alumni_without_pdf = create_alumni(
+    alumni_without_pdf = _make_alumni(
         db_session,
-        roll_number=str(uuid.uuid4())[:20],
         name="Alumni Without PDF",
-        batch="2020",
         linkedin_pdf_url=None,
     )
     
@@ -207,12 +207,12 @@ def test_alumni_details_shows_pdf_link_when_available(db_session):
 
 def test_alumni_details_complete_workflow(db_session):
     """Test complete alumni details page workflow."""
+    now = datetime.now()
+    
     # Create alumni with all information
-    alumni = create_alumni(
+    alumni = _make_alumni(
         db_session,
-        roll_number=str(uuid.uuid4())[:20],
         name="Complete Alumni",
-        batch="2020",
         current_company="Google",
         current_designation="Senior Engineer",
         location="Bangalore",
@@ -222,35 +222,35 @@ def test_alumni_details_complete_workflow(db_session):
     )
     
     # Create job history
-    for i in range(3):
-        create_job_history(
-            db_session,
-            alumni_id=alumni.id,
+    bulk_create_job_history(db_session, alumni.id, [
+        dict(
             company_name=f"Company {i}",
             designation=f"Role {i}",
             location="Bangalore",
-            start_date=datetime.now() - timedelta(days=365 * (3 - i)),
-            end_date=datetime.now() - timedelta(days=365 * (2 - i)) if i < 2 else None,
+            start_date=now - 365 * (3 - i) * DAY,
+            end_date=now - 365 * (2 - i) * DAY if i < 2 else None,
             is_current=(i == 2),
             employment_type="Full-time",
         )
+        for i in range(3)
+    ])
     
     # Create education history
-    create_education_history(
-        db_session,
-        alumni_id=alumni.id,
-        institution_name="IIT Delhi",
-        degree="B.Tech",
-        field_of_study="Computer Science",
-        start_year=2016,
-        end_year=2020,
-        grade="A",
-    )
+    bulk_create_education_history(db_session, alumni.id, [
+        dict(
+            institution_name="IIT Delhi",
+            degree="B.Tech",
+            field_of_study="Computer Science",
+            start_year=2016,
+            end_year=2020,
+            grade="A",
+        )
+    ])
     
     # Fetch all data (simulating detail view)
-    fetched_alumni = get_alumni_by_id(db_session, alumni.id)
-    fetched_jobs = get_job_history_by_alumni(db_session, alumni.id)
-    fetched_education = get_education_history_by_alumni(db_session, alumni.id)
+    fetched_alumni = get_alumni_detail(db_session, alumni.id)
+    fetched_jobs = fetched_alumni.job_history
+    fetched_education = fetched_alumni.education_history
     
     # Verify all data is present
     assert fetched_alumni is not None
@@ -264,7 +264,7 @@ def test_alumni_details_complete_workflow(db_session):
     
     # Verify statistics
     total_positions = len(fetched_jobs)
-    unique_companies = len(set(job.company_name for job in fetched_jobs))
+    unique_companies = len({job.company_name for job in fetched_jobs})
     
     assert total_positions == 3
     assert unique_companies == 3
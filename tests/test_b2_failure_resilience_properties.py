@@ -12,6 +12,11 @@ from datetime import datetime
 
 class MockAlumni:
     """Mock Alumni object for testing."""
+    __slots__ = (
+        "id", "roll_number", "name", "linkedin_url", "current_company",
+        "current_designation", "location", "linkedin_pdf_url", "last_scraped_at",
+    )
+
     def __init__(self, alumni_id: int, roll_number: str):
         self.id = alumni_id
         self.roll_number = roll_number
@@ -26,6 +31,8 @@ class MockAlumni:
 
 class MockDatabase:
     """Mock database for testing."""
+    __slots__ = ("alumni", "committed", "rolled_back")
+
     def __init__(self):
         self.alumni = {}
         self.committed = False
@@ -49,7 +56,7 @@ class MockDatabase:
         return self.alumni.get(alumni_id)
 
 
-async def simulate_scraping_with_b2_failure(alumni, scraped_data, b2_should_fail=True):
+def simulate_scraping_with_b2_failure(alumni, scraped_data, b2_should_fail=True, now=None):
     """
     Simulate scraping operation where B2 upload may fail.
     
@@ -63,6 +70,7 @@ async def simulate_scraping_with_b2_failure(alumni, scraped_data, b2_should_fail
         alumni: Alumni object to update
         scraped_data: Dictionary of scraped data
         b2_should_fail: Whether B2 upload should fail
+        now: Scrape timestamp; defaults to the current UTC time
     
     Returns:
         Tuple of (database_saved, pdf_uploaded)
@@ -76,7 +84,7 @@ async def simulate_scraping_with_b2_failure(alumni, scraped_data, b2_should_fail
         alumni.current_company = scraped_data.get("current_company")
         alumni.current_designation = scraped_data.get("current_designation")
         alumni.location = scraped_data.get("location")
-        alumni.last_scraped_at = datetime.utcnow()
+        alumni.last_scraped_at = now or datetime.utcnow()
         
         # Step 2: Save to database
         db.save_alumni(alumni)
@@ -103,16 +111,15 @@ async def simulate_scraping_with_b2_failure(alumni, scraped_data, b2_should_fail
     return database_saved, pdf_uploaded
 
 
-@given(
-    alumni_id=st.integers(min_value=1, max_value=1000),
-    roll_number=st.text(min_size=5, max_size=10, alphabet=st.characters(whitelist_categories=('Lu', 'Nd'))),
-    company=st.text(min_size=3, max_size=50),
-    designation=st.text(min_size=3, max_size=50),
-    location=st.text(min_size=3, max_size=50)
-)
-@settings(max_examples=100, deadline=None)
-@pytest.mark.asyncio
-async def test_b2_failures_dont_prevent_database_saves(
+# The outcome does not depend on the field values, so a few representative
+# cases cover the B2-failure branch as well as generated ones would
+@pytest.mark.parametrize("alumni_id,roll_number,company,designation,location", [
+    (1, "ABC01", "Google", "Software Engineer", "Bangalore"),
+    (999, "ZZZ99", "Microsoft", "Product Manager", "San Francisco"),
+    (42, "X1", "", "", ""),
+    (7, "M218-23", "Société Générale", "Analyste — Risque", "Zürich"),
+])
+def test_b2_failures_dont_prevent_database_saves(
     alumni_id,
     roll_number,
     company,
@@ -138,7 +145,7 @@ async def test_b2_failures_dont_prevent_database_saves(
     }
     
     # Simulate scraping with B2 failure
-    database_saved, pdf_uploaded = await simulate_scraping_with_b2_failure(
+    database_saved, pdf_uploaded = simulate_scraping_with_b2_failure(
         alumni,
         scraped_data,
         b2_should_fail=True
@@ -167,8 +174,7 @@ async def test_b2_failures_dont_prevent_database_saves(
         "PDF URL should not be set when B2 upload fails"
 
 
-@pytest.mark.asyncio
-async def test_b2_failure_doesnt_rollback_database():
+def test_b2_failure_doesnt_rollback_database():
     """
     Test that B2 failure doesn't cause database rollback.
     """
@@ -180,7 +186,7 @@ async def test_b2_failure_doesnt_rollback_database():
     }
     
     # Simulate scraping with B2 failure
-    database_saved, pdf_uploaded = await simulate_scraping_with_b2_failure(
+    database_saved, pdf_uploaded = simulate_scraping_with_b2_failure(
         alumni,
         scraped_data,
         b2_should_fail=True
@@ -196,8 +202,7 @@ async def test_b2_failure_doesnt_rollback_database():
     assert alumni.location == "Test Location"
 
 
-@pytest.mark.asyncio
-async def test_b2_success_saves_pdf_url():
+def test_b2_success_saves_pdf_url():
     """
     Test that when B2 succeeds, PDF URL is saved.
     """
@@ -209,7 +214,7 @@ async def test_b2_success_saves_pdf_url():
     }
     
     # Simulate scraping with B2 success
-    database_saved, pdf_uploaded = await simulate_scraping_with_b2_failure(
+    database_saved, pdf_uploaded = simulate_scraping_with_b2_failure(
         alumni,
         scraped_data,
         b2_should_fail=False
@@ -229,8 +234,7 @@ async def test_b2_success_saves_pdf_url():
     num_b2_failures=st.integers(min_value=1, max_value=5)
 )
 @settings(max_examples=50, deadline=None)
-@pytest.mark.asyncio
-async def test_partial_b2_failures_dont_affect_database_saves(num_profiles, num_b2_failures):
+def test_partial_b2_failures_dont_affect_database_saves(num_profiles, num_b2_failures):
     """
     Test that in a batch where some B2 uploads fail, all database saves succeed.
     """
@@ -238,29 +242,28 @@ async def test_partial_b2_failures_dont_affect_database_saves(num_profiles, num_
     if num_b2_failures >= num_profiles:
         num_b2_failures = num_profiles - 1
     
-    # Create test alumni
-    alumni_list = [
-        MockAlumni(i, f"TEST{i:03d}")
+    # Create test alumni paired with their scraped data
+    pairs = [
+        (
+            MockAlumni(i, f"TEST{i:03d}"),
+            {
+                "current_company": f"Company {i}",
+                "current_designation": f"Role {i}",
+                "location": f"Location {i}"
+            },
+        )
         for i in range(num_profiles)
     ]
     
-    # Determine which will have B2 failures
-    b2_failure_indices = set(range(num_b2_failures))
-    
-    # Process each alumni
+    # Process each alumni; the first num_b2_failures have B2 failures
+    now = datetime.utcnow()
     results = []
-    for i, alumni in enumerate(alumni_list):
-        scraped_data = {
-            "current_company": f"Company {i}",
-            "current_designation": f"Role {i}",
-            "location": f"Location {i}"
-        }
-        
-        b2_should_fail = i in b2_failure_indices
-        database_saved, pdf_uploaded = await simulate_scraping_with_b2_failure(
+    for i, (alumni, scraped_data) in enumerate(pairs):
+        database_saved, pdf_uploaded = simulate_scraping_with_b2_failure(
             alumni,
             scraped_data,
-            b2_should_fail=b2_should_fail
+            b2_should_fail=i < num_b2_failures,
+            now=now,
         )
         
         results.append({
@@ -10,32 +10,35 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-from hypothesis import given, settings, HealthCheck
+from hypothesis import example, given, settings
 from hypothesis import strategies as st
 
-from alumni_system.database.crud import create_alumni, get_alumni_by_id, update_alumni
+from alumni_system.database.crud import create_alumni, update_alumni
 from alumni_system.database.models import Alumni
 from alumni_system.scraper.linkedin_scraper import LinkedInScraper
+from tests.strategies import ALUMNI_STRATEGY as BASE_ALUMNI_STRATEGY
 
 
-# Generators for test data
-@st.composite
-def alumni_data(draw):
-    """Generate random alumni data."""
-    roll_number = draw(st.text(
-        alphabet=st.characters(whitelist_categories=("Lu", "Nd")),
-        min_size=5,
-        max_size=15
-    ))
-    name = draw(st.text(min_size=3, max_size=50))
-    batch = draw(st.integers(min_value=2000, max_value=2030))
-    
-    return {
-        "roll_number": roll_number,
-        "name": name,
-        "batch": str(batch),
-        "linkedin_url": f"https://www.linkedin.com/in/{roll_number.lower()}",
-    }
+# Fixed clock for filenames and mock payloads; only their format is checked
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+FIXED_TS = FIXED_NOW.strftime("%Y%m%d_%H%M%S")
+
+# Expected B2 object name; the roll number is captured and compared
+PDF_FILENAME_RE = re.compile(r"^linkedin_profiles/(?P<roll>[^/]+)_(?P<ts>\d{8}_\d{6})\.pdf$")
+
+
+# Shared alumni records plus the LinkedIn URL the scraper would be given
+ALUMNI_STRATEGY = BASE_ALUMNI_STRATEGY.map(
+    lambda alumni: {**alumni, "linkedin_url": f"https://www.linkedin.com/in/{alumni['roll_number'].lower()}"}
+)
+
+# Always-run edge case: shortest roll number, all digits
+MIN_ROLL_ALUMNI = {
+    "roll_number": "00000",
+    "name": "Min Roll",
+    "batch": "2000",
+    "linkedin_url": "https://www.linkedin.com/in/00000",
+}
 
 
 @st.composite
@@ -46,11 +49,20 @@ def pdf_bytes_data(draw):
     return b"%PDF-1.4\n" + draw(st.binary(min_size=size, max_size=size))
 
 
+@pytest.fixture(scope="module")
+def mocked_scraper():
+    """LinkedInScraper whose PDF download returns fixed bytes, patched once per module."""
+    mock_pdf_bytes = b"%PDF-1.4\nMocked PDF content"
+    with patch.object(LinkedInScraper, 'download_profile_pdf', new=AsyncMock(return_value=mock_pdf_bytes)):
+        yield LinkedInScraper()
+
+
 # Property 18: Successful scrape generates PDF
 @pytest.mark.asyncio
-@given(alumni=alumni_data())
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-async def test_property_18_successful_scrape_generates_pdf(alumni, db_session):
+@given(alumni=ALUMNI_STRATEGY)
+@example(alumni=MIN_ROLL_ALUMNI)
+@settings(max_examples=25, deadline=None)
+async def test_property_18_successful_scrape_generates_pdf(alumni, db_session, mocked_scraper):
     """
     **Feature: alumni-management-system, Property 18: Successful scrape generates PDF**
     
@@ -59,30 +71,21 @@ async def test_property_18_successful_scrape_generates_pdf(alumni, db_session):
     """
     # Create alumni record
     alumni_record = create_alumni(db_session, **alumni)
-    db_session.commit()
-    
-    # Mock the scraper to simulate successful scraping
-    with patch.object(LinkedInScraper, 'download_profile_pdf', new_callable=AsyncMock) as mock_download:
-        # Simulate PDF generation
-        mock_pdf_bytes = b"%PDF-1.4\nMocked PDF content"
-        mock_download.return_value = mock_pdf_bytes
-        
-        # Create scraper instance
-        scraper = LinkedInScraper()
-        
-        # Call download_profile_pdf
-        pdf_result = await scraper.download_profile_pdf(alumni["linkedin_url"])
-        
-        # Property: Successful scrape should generate PDF bytes
-        assert pdf_result is not None, "Successful scrape should generate PDF"
-        assert len(pdf_result) > 0, "PDF should have content"
-        assert pdf_result.startswith(b"%PDF"), "PDF should have valid header"
+    
+    # Call download_profile_pdf on the mocked scraper
+    pdf_result = await mocked_scraper.download_profile_pdf(alumni["linkedin_url"])
+    
+    # Property: Successful scrape should generate PDF bytes
+    assert pdf_result is not None, "Successful scrape should generate PDF"
+    assert len(pdf_result) > 0, "PDF should have content"
+    assert pdf_result.startswith(b"%PDF"), "PDF should have valid header"
 
 
 # Property 20: PDF naming convention is consistent
 @pytest.mark.asyncio
-@given(alumni=alumni_data())
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(alumni=ALUMNI_STRATEGY)
+@example(alumni=MIN_ROLL_ALUMNI)
+@settings(max_examples=25, deadline=None)
 async def test_property_20_pdf_naming_convention(alumni, db_session):
     """
     **Feature: alumni-management-system, Property 20: PDF naming convention is consistent**
@@ -93,18 +96,17 @@ async def test_property_20_pdf_naming_convention(alumni, db_session):
     """
     # Create alumni record
     alumni_record = create_alumni(db_session, **alumni)
-    db_session.commit()
     
     # Test the naming convention directly without importing B2Client
     # This simulates what the B2Client.upload_pdf_bytes method does
     
     # Capture the filename that would be generated
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    timestamp = FIXED_TS
     generated_filename = f"linkedin_profiles/{alumni['roll_number']}_{timestamp}.pdf"
     
     # Property: Filename should match pattern linkedin_profiles/{roll_number}_{timestamp}.pdf
-    pattern = rf"^linkedin_profiles/{re.escape(alumni['roll_number'])}_\d{{8}}_\d{{6}}\.pdf$"
-    assert re.match(pattern, generated_filename), \
+    match = PDF_FILENAME_RE.match(generated_filename)
+    assert match and match.group("roll") == alumni['roll_number'], \
         f"Filename '{generated_filename}' should match pattern 'linkedin_profiles/{{roll_number}}_{{timestamp}}.pdf'"
     
     # Verify the pattern components
@@ -118,8 +120,9 @@ async def test_property_20_pdf_naming_convention(alumni, db_session):
 
 # Property 21: Successful upload stores URL
 @pytest.mark.asyncio
-@given(alumni=alumni_data())
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(alumni=ALUMNI_STRATEGY)
+@example(alumni=MIN_ROLL_ALUMNI)
+@settings(max_examples=25, deadline=None)
 async def test_property_21_successful_upload_stores_url(alumni, db_session):
     """
     **Feature: alumni-management-system, Property 21: Successful upload stores URL**
@@ -130,11 +133,9 @@ async def test_property_21_successful_upload_stores_url(alumni, db_session):
     # Create alumni record without PDF URL
     alumni_data_dict = {**alumni, "linkedin_pdf_url": None}
     alumni_record = create_alumni(db_session, **alumni_data_dict)
-    db_session.commit()
     
-    # Get the initial state
-    initial_alumni = get_alumni_by_id(db_session, alumni_record.id)
-    initial_pdf_url = initial_alumni.linkedin_pdf_url
+    # Get the initial state (create_alumni already refreshed the record)
+    initial_pdf_url = alumni_record.linkedin_pdf_url
     
     # Simulate successful B2 upload
     expected_url = f"https://example.com/file/{alumni['roll_number']}_new"
@@ -145,29 +146,29 @@ async def test_property_21_successful_upload_stores_url(alumni, db_session):
         "file_name": f"linkedin_profiles/{alumni['roll_number']}_20240101_120000.pdf",
         "download_url": expected_url,
         "size_bytes": 1000,
-        "uploaded_at": datetime.utcnow().isoformat(),
+        "uploaded_at": FIXED_NOW.isoformat(),
     }
     
     # Update alumni record with URL (simulating what happens after successful upload)
     update_alumni(db_session, alumni_record.id, linkedin_pdf_url=upload_result["download_url"])
-    db_session.commit()
     
     # Refresh from database
-    updated_alumni = get_alumni_by_id(db_session, alumni_record.id)
+    db_session.refresh(alumni_record)
     
     # Property: Successful upload should store URL in alumni record
-    assert updated_alumni.linkedin_pdf_url is not None, \
+    assert alumni_record.linkedin_pdf_url is not None, \
         "Successful upload should store URL"
-    assert updated_alumni.linkedin_pdf_url == expected_url, \
+    assert alumni_record.linkedin_pdf_url == expected_url, \
         "Stored URL should match the upload result"
-    assert updated_alumni.linkedin_pdf_url != initial_pdf_url, \
+    assert alumni_record.linkedin_pdf_url != initial_pdf_url, \
         "URL should be updated from initial state"
 
 
 # Property 22: B2 upload failure doesn't fail scraping
 @pytest.mark.asyncio
-@given(alumni=alumni_data())
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(alumni=ALUMNI_STRATEGY)
+@example(alumni=MIN_ROLL_ALUMNI)
+@settings(max_examples=25, deadline=None)
 async def test_property_22_b2_failure_doesnt_fail_scraping(alumni, db_session):
     """
     **Feature: alumni-management-system, Property 22: B2 upload failure doesn't fail scraping**
@@ -178,7 +179,6 @@ async def test_property_22_b2_failure_doesnt_fail_scraping(alumni, db_session):
     """
     # Create alumni record
     alumni_record = create_alumni(db_session, **alumni)
-    db_session.commit()
     
     # Simulate the scraping workflow with B2 failure
     # This tests that the error handling allows database saves to proceed
@@ -191,9 +191,8 @@ async def test_property_22_b2_failure_doesnt_fail_scraping(alumni, db_session):
         current_company="Test Company",
         current_designation="Test Role",
         location="Test Location",
-        last_scraped_at=datetime.utcnow()
+        last_scraped_at=FIXED_NOW
     )
-    db_session.commit()
     
     # Step 2: Simulate B2 upload failure
     # In the real implementation, the _store_profile_pdf_safe method catches exceptions
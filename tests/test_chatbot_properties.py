@@ -7,397 +7,407 @@ These tests verify that the chatbot query executor correctly filters
 and returns alumni based on different query types.
 """
 
+import itertools
+
 import pytest
-import uuid
-from hypothesis import given, strategies as st, settings, HealthCheck
+from hypothesis import given, strategies as st
 
 from alumni_system.chatbot.query_parser import QueryParser, ParsedQuery
 from alumni_system.chatbot.query_executor import QueryExecutor
 from alumni_system.database.models import Alumni
-from alumni_system.database.crud import create_alumni
+from tests.db_helpers import bulk_create_alumni
+
+
+# Per-process counter behind the roll-number prefixes; examples of one test
+# share a session, so each needs a fresh prefix
+_TEST_ID_COUNTER = itertools.count()
+
+
+def _next_test_id() -> str:
+    """Return a unique 8-character test ID for this process."""
+    return f"{next(_TEST_ID_COUNTER):08x}"
 
 
-class TestChatbotQueryProperties:
-    """Property-based tests for chatbot query execution."""
+@pytest.fixture
+def query_executor(db_session):
+    """QueryExecutor on the test session, shared by all examples of a test."""
+    return QueryExecutor(db_session)
+
+
+@given(
+    company_name=st.sampled_from(["Google", "Microsoft", "Amazon", "Meta", "Apple"]),
+    num_matching=st.integers(min_value=1, max_value=10),
+    num_non_matching=st.integers(min_value=0, max_value=10)
+)
+def test_company_queries_return_only_matching_alumni(
+    db_session, query_executor, company_name, num_matching, num_non_matching
+):
+    """
+    **Feature: alumni-management-system, Property 31: Company queries return only matching alumni**
+    **Validates: Requirements 5.2**
+    
+    For any company name C, a company query for C should return only alumni
+    where current_company equals C.
+    """
+    # Generate unique test ID to avoid collisions between Hypothesis examples
+    test_id = _next_test_id()
+    
+    # Create matching alumni
+    bulk_create_alumni(db_session, [
+        dict(
+            roll_number=f"MATCH_{test_id}_{i}",
+            name=f"Match Alumni {i}",
+            current_company=company_name,
+            batch="2020",
+        )
+        for i in range(num_matching)
+    ])
     
-    @given(
-        company_name=st.sampled_from(["Google", "Microsoft", "Amazon", "Meta", "Apple"]),
-        num_matching=st.integers(min_value=1, max_value=10),
-        num_non_matching=st.integers(min_value=0, max_value=10)
+    # Create non-matching alumni with different companies
+    other_companies = ["OtherCorp", "DifferentInc", "AnotherLtd"]
+    bulk_create_alumni(db_session, [
+        dict(
+            roll_number=f"NOMATCH_{test_id}_{i}",
+            name=f"NoMatch Alumni {i}",
+            current_company=other_companies[i % len(other_companies)],
+            batch="2020",
+        )
+        for i in range(num_non_matching)
+    ])
+    
+    # Create parsed query for company
+    parsed_query = ParsedQuery(
+        intent="find_by_company",
+        entities={"company": company_name},
+        raw_query=f"Who works at {company_name}?"
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-    def test_company_queries_return_only_matching_alumni(
-        self, db_session, company_name, num_matching, num_non_matching
-    ):
-        """
-        **Feature: alumni-management-system, Property 31: Company queries return only matching alumni**
-        **Validates: Requirements 5.2**
-        
-        For any company name C, a company query for C should return only alumni
-        where current_company equals C.
-        """
-        # Generate unique test ID to avoid collisions between Hypothesis examples
-        test_id = str(uuid.uuid4())[:8]
-        
-        # Create matching alumni
-        for i in range(num_matching):
-            create_alumni(
-                db_session,
-                roll_number=f"MATCH_{test_id}_{i}",
-                name=f"Match Alumni {i}",
-                current_company=company_name,
-                batch="2020"
-            )
-        
-        # Create non-matching alumni with different companies
-        other_companies = ["OtherCorp", "DifferentInc", "AnotherLtd"]
-        for i in range(num_non_matching):
-            create_alumni(
-                db_session,
-                roll_number=f"NOMATCH_{test_id}_{i}",
-                name=f"NoMatch Alumni {i}",
-                current_company=other_companies[i % len(other_companies)],
-                batch="2020"
-            )
-        
-        # Create parsed query for company
-        parsed_query = ParsedQuery(
-            intent="find_by_company",
-            entities={"company": company_name},
-            raw_query=f"Who works at {company_name}?"
+    
+    # Execute query
+    response = query_executor.execute(parsed_query)
+    
+    # Verify all results match the company (property holds regardless of count)
+    # The key property is that ALL returned alumni work at the specified company
+    assert response.count >= num_matching, f"Should have at least {num_matching} matching alumni"
+    assert len(response.alumni) >= num_matching
+    
+    # The critical property: ALL results must match the company
+    assert all(alumni["current_company"] == company_name for alumni in response.alumni), \
+        f"Expected company {company_name}, got {[(a['name'], a['current_company']) for a in response.alumni if a['current_company'] != company_name]}"
+
+
+@given(
+    batch_year=st.sampled_from(["2018", "2019", "2020", "2021", "2022"]),
+    num_matching=st.integers(min_value=1, max_value=10),
+    num_non_matching=st.integers(min_value=0, max_value=10)
+)
+def test_batch_queries_return_only_matching_alumni(
+    db_session, query_executor, batch_year, num_matching, num_non_matching
+):
+    """
+    **Feature: alumni-management-system, Property 32: Batch queries return only matching alumni**
+    **Validates: Requirements 5.3**
+    
+    For any batch value B, a batch query for B should return only alumni
+    where batch equals B.
+    """
+    # Generate unique test ID to avoid collisions between Hypothesis examples
+    test_id = _next_test_id()
+    
+    # Create matching alumni
+    bulk_create_alumni(db_session, [
+        dict(
+            roll_number=f"MATCH_{test_id}_{i}",
+            name=f"Match Alumni {i}",
+            batch=batch_year,
+            current_company="TestCorp",
+        )
+        for i in range(num_matching)
+    ])
+    
+    # Create non-matching alumni with different batches
+    other_batches = ["2015", "2016", "2017"]
+    bulk_create_alumni(db_session, [
+        dict(
+            roll_number=f"NOMATCH_{test_id}_{i}",
+            name=f"NoMatch Alumni {i}",
+            batch=other_batches[i % len(other_batches)],
+            current_company="TestCorp",
         )
-        
-        # Execute query
-        executor = QueryExecutor(db_session)
-        response = executor.execute(parsed_query)
-        
-        # Verify all results match the company (property holds regardless of count)
-        # The key property is that ALL returned alumni work at the specified company
-        assert response.count >= num_matching, f"Should have at least {num_matching} matching alumni"
-        assert len(response.alumni) >= num_matching
-        
-        # The critical property: ALL results must match the company
-        for alumni in response.alumni:
-            assert alumni["current_company"] == company_name, \
-                f"Alumni {alumni['name']} has company {alumni['current_company']}, expected {company_name}"
-    
-    @given(
-        batch_year=st.sampled_from(["2018", "2019", "2020", "2021", "2022"]),
-        num_matching=st.integers(min_value=1, max_value=10),
-        num_non_matching=st.integers(min_value=0, max_value=10)
+        for i in range(num_non_matching)
+    ])
+    
+    # Create parsed query for batch
+    parsed_query = ParsedQuery(
+        intent="find_by_batch",
+        entities={"batch": batch_year},
+        raw_query=f"Find alumni from batch {batch_year}"
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-    def test_batch_queries_return_only_matching_alumni(
-        self, db_session, batch_year, num_matching, num_non_matching
-    ):
-        """
-        **Feature: alumni-management-system, Property 32: Batch queries return only matching alumni**
-        **Validates: Requirements 5.3**
-        
-        For any batch value B, a batch query for B should return only alumni
-        where batch equals B.
-        """
-        # Generate unique test ID to avoid collisions between Hypothesis examples
-        test_id = str(uuid.uuid4())[:8]
-        
-        # Create matching alumni
-        for i in range(num_matching):
-            create_alumni(
-                db_session,
-                roll_number=f"MATCH_{test_id}_{i}",
-                name=f"Match Alumni {i}",
-                batch=batch_year,
-                current_company="TestCorp"
-            )
-        
-        # Create non-matching alumni with different batches
-        other_batches = ["2015", "2016", "2017"]
-        for i in range(num_non_matching):
-            create_alumni(
-                db_session,
-                roll_number=f"NOMATCH_{test_id}_{i}",
-                name=f"NoMatch Alumni {i}",
-                batch=other_batches[i % len(other_batches)],
-                current_company="TestCorp"
-            )
-        
-        # Create parsed query for batch
-        parsed_query = ParsedQuery(
-            intent="find_by_batch",
-            entities={"batch": batch_year},
-            raw_query=f"Find alumni from batch {batch_year}"
+    
+    # Execute query
+    response = query_executor.execute(parsed_query)
+    
+    # Verify all results match the batch (property holds regardless of count)
+    # The key property is that ALL returned alumni are from the specified batch
+    assert response.count >= num_matching, f"Should have at least {num_matching} matching alumni"
+    assert len(response.alumni) >= num_matching
+    
+    # The critical property: ALL results must match the batch
+    assert all(alumni["batch"] == batch_year for alumni in response.alumni), \
+        f"Expected batch {batch_year}, got {[(a['name'], a['batch']) for a in response.alumni if a['batch'] != batch_year]}"
+
+
+@given(
+    title=st.sampled_from(["software engineer", "data scientist", "product manager", "analyst"]),
+    num_matching=st.integers(min_value=1, max_value=10),
+    num_non_matching=st.integers(min_value=0, max_value=10)
+)
+def test_title_queries_return_only_matching_alumni(
+    db_session, query_executor, title, num_matching, num_non_matching
+):
+    """
+    **Feature: alumni-management-system, Property 33: Title queries return only matching alumni**
+    **Validates: Requirements 5.4**
+    
+    For any job title T, a title query for T should return only alumni
+    where current_designation contains T.
+    """
+    # Generate unique test ID to avoid collisions between Hypothesis examples
+    test_id = _next_test_id()
+    
+    # Create matching alumni
+    bulk_create_alumni(db_session, [
+        dict(
+            roll_number=f"MATCH_{test_id}_{i}",
+            name=f"Match Alumni {i}",
+            current_designation=title,
+            current_company="TestCorp",
+            batch="2020",
+        )
+        for i in range(num_matching)
+    ])
+    
+    # Create non-matching alumni with different titles
+    other_titles = ["manager", "director", "consultant"]
+    bulk_create_alumni(db_session, [
+        dict(
+            roll_number=f"NOMATCH_{test_id}_{i}",
+            name=f"NoMatch Alumni {i}",
+            current_designation=other_titles[i % len(other_titles)],
+            current_company="TestCorp",
+            batch="2020",
         )
-        
-        # Execute query
-        executor = QueryExecutor(db_session)
-        response = executor.execute(parsed_query)
-        
-        # Verify all results match the batch (property holds regardless of count)
-        # The key property is that ALL returned alumni are from the specified batch
-        assert response.count >= num_matching, f"Should have at least {num_matching} matching alumni"
-        assert len(response.alumni) >= num_matching
-        
-        # The critical property: ALL results must match the batch
-        for alumni in response.alumni:
-            assert alumni["batch"] == batch_year, \
-                f"Alumni {alumni['name']} has batch {alumni['batch']}, expected {batch_year}"
-    
-    @given(
-        title=st.sampled_from(["software engineer", "data scientist", "product manager", "analyst"]),
-        num_matching=st.integers(min_value=1, max_value=10),
-        num_non_matching=st.integers(min_value=0, max_value=10)
+        for i in range(num_non_matching)
+    ])
+    
+    # Create parsed query for title
+    parsed_query = ParsedQuery(
+        intent="find_by_title",
+        entities={"title": title},
+        raw_query=f"Find {title}s"
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-    def test_title_queries_return_only_matching_alumni(
-        self, db_session, title, num_matching, num_non_matching
-    ):
-        """
-        **Feature: alumni-management-system, Property 33: Title queries return only matching alumni**
-        **Validates: Requirements 5.4**
-        
-        For any job title T, a title query for T should return only alumni
-        where current_designation contains T.
-        """
-        # Generate unique test ID to avoid collisions between Hypothesis examples
-        test_id = str(uuid.uuid4())[:8]
-        
-        # Create matching alumni
-        for i in range(num_matching):
-            create_alumni(
-                db_session,
-                roll_number=f"MATCH_{test_id}_{i}",
-                name=f"Match Alumni {i}",
-                current_designation=title,
-                current_company="TestCorp",
-                batch="2020"
-            )
-        
-        # Create non-matching alumni with different titles
-        other_titles = ["manager", "director", "consultant"]
-        for i in range(num_non_matching):
-            create_alumni(
-                db_session,
-                roll_number=f"NOMATCH_{test_id}_{i}",
-                name=f"NoMatch Alumni {i}",
-                current_designation=other_titles[i % len(other_titles)],
-                current_company="TestCorp",
-                batch="2020"
-            )
-        
-        # Create parsed query for title
-        parsed_query = ParsedQuery(
-            intent="find_by_title",
-            entities={"title": title},
-            raw_query=f"Find {title}s"
+    
+    # Execute query
+    response = query_executor.execute(parsed_query)
+    
+    # Verify all results match the title (property holds regardless of count)
+    # The key property is that ALL returned alumni have the specified title
+    assert response.count >= num_matching, f"Should have at least {num_matching} matching alumni"
+    assert len(response.alumni) >= num_matching
+    
+    # The critical property: ALL results must match the title
+    assert all(alumni["current_designation"] == title for alumni in response.alumni), \
+        f"Expected title {title}, got {[(a['name'], a['current_designation']) for a in response.alumni if a['current_designation'] != title]}"
+
+
+@given(
+    num_alumni=st.integers(min_value=0, max_value=50),
+    filter_type=st.sampled_from(["none", "company", "batch"])
+)
+def test_count_queries_return_accurate_counts(
+    db_session, query_executor, num_alumni, filter_type
+):
+    """
+    **Feature: alumni-management-system, Property 34: Count queries return accurate counts**
+    **Validates: Requirements 5.5**
+    
+    For any query that requests a count, the returned count should equal
+    the number of matching alumni in the database.
+    """
+    # Generate unique test ID to avoid collisions between Hypothesis examples
+    test_id = _next_test_id()
+    
+    # Create alumni
+    bulk_create_alumni(db_session, [
+        dict(
+            roll_number=f"COUNT_{test_id}_{i}",
+            name=f"Alumni {i}",
+            current_company="Google" if i % 2 == 0 else "Microsoft",
+            batch="2020" if i % 3 == 0 else "2021",
         )
-        
-        # Execute query
-        executor = QueryExecutor(db_session)
-        response = executor.execute(parsed_query)
-        
-        # Verify all results match the title (property holds regardless of count)
-        # The key property is that ALL returned alumni have the specified title
-        assert response.count >= num_matching, f"Should have at least {num_matching} matching alumni"
-        assert len(response.alumni) >= num_matching
-        
-        # The critical property: ALL results must match the title
-        for alumni in response.alumni:
-            assert alumni["current_designation"] == title, \
-                f"Alumni {alumni['name']} has title {alumni['current_designation']}, expected {title}"
-    
-    @given(
-        num_alumni=st.integers(min_value=0, max_value=50),
-        filter_type=st.sampled_from(["none", "company", "batch"])
+        for i in range(num_alumni)
+    ])
+    
+    # Build query based on filter type
+    entities = {}
+    expected_count = num_alumni
+    
+    if filter_type == "company":
+        entities["company"] = "Google"
+        # Count how many have Google: even i in range(num_alumni)
+        expected_count = (num_alumni + 1) // 2
+    elif filter_type == "batch":
+        entities["batch"] = "2020"
+        # Count how many have batch 2020: i % 3 == 0 in range(num_alumni)
+        expected_count = (num_alumni + 2) // 3
+    
+    # Create parsed query for count
+    parsed_query = ParsedQuery(
+        intent="count",
+        entities=entities,
+        raw_query="How many alumni?"
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture], deadline=500)
-    def test_count_queries_return_accurate_counts(
-        self, db_session, num_alumni, filter_type
-    ):
-        """
-        **Feature: alumni-management-system, Property 34: Count queries return accurate counts**
-        **Validates: Requirements 5.5**
-        
-        For any query that requests a count, the returned count should equal
-        the number of matching alumni in the database.
-        """
-        # Generate unique test ID to avoid collisions between Hypothesis examples
-        test_id = str(uuid.uuid4())[:8]
-        
-        # Create alumni
-        for i in range(num_alumni):
-            company = "Google" if i % 2 == 0 else "Microsoft"
-            batch = "2020" if i % 3 == 0 else "2021"
-            
-            create_alumni(
-                db_session,
-                roll_number=f"COUNT_{test_id}_{i}",
-                name=f"Alumni {i}",
-                current_company=company,
-                batch=batch
-            )
-        
-        # Build query based on filter type
-        entities = {}
-        expected_count = num_alumni
-        
-        if filter_type == "company":
-            entities["company"] = "Google"
-            # Count how many have Google
-            expected_count = sum(1 for i in range(num_alumni) if i % 2 == 0)
-        elif filter_type == "batch":
-            entities["batch"] = "2020"
-            # Count how many have batch 2020
-            expected_count = sum(1 for i in range(num_alumni) if i % 3 == 0)
-        
-        # Create parsed query for count
-        parsed_query = ParsedQuery(
-            intent="count",
-            entities=entities,
-            raw_query="How many alumni?"
+    
+    # Execute query
+    response = query_executor.execute(parsed_query)
+    
+    # Verify count is accurate (at least the expected count due to data accumulation)
+    # The key property is that the count matches the actual number of matching records
+    assert response.count >= expected_count, f"Should have at least {expected_count} matching alumni"
+    
+    # Verify the count matches the actual alumni list length
+    assert response.count == len(response.alumni) if len(response.alumni) > 0 else response.count >= 0
+
+
+@given(
+    location=st.sampled_from(["Bangalore", "Mumbai", "Delhi", "Hyderabad", "Pune"]),
+    num_matching=st.integers(min_value=1, max_value=10),
+    num_non_matching=st.integers(min_value=0, max_value=10)
+)
+def test_location_queries_return_only_matching_alumni(
+    db_session, query_executor, location, num_matching, num_non_matching
+):
+    """
+    **Feature: alumni-management-system, Property 35: Location queries return only matching alumni**
+    **Validates: Requirements 5.6**
+    
+    For any location L, a location query for L should return only alumni
+    where location equals L.
+    """
+    # Generate unique test ID to avoid collisions between Hypothesis examples
+    test_id = _next_test_id()
+    
+    # Create matching alumni
+    bulk_create_alumni(db_session, [
+        dict(
+            roll_number=f"MATCH_{test_id}_{i}",
+            name=f"Match Alumni {i}",
+            location=location,
+            current_company="TestCorp",
+            batch="2020",
+        )
+        for i in range(num_matching)
+    ])
+    
+    # Create non-matching alumni with different locations
+    other_locations = ["Chennai", "Kolkata", "Gurgaon"]
+    bulk_create_alumni(db_session, [
+        dict(
+            roll_number=f"NOMATCH_{test_id}_{i}",
+            name=f"NoMatch Alumni {i}",
+            location=other_locations[i % len(other_locations)],
+            current_company="TestCorp",
+            batch="2020",
         )
-        
-        # Execute query
-        executor = QueryExecutor(db_session)
-        response = executor.execute(parsed_query)
-        
-        # Verify count is accurate (at least the expected count due to data accumulation)
-        # The key property is that the count matches the actual number of matching records
-        assert response.count >= expected_count, f"Should have at least {expected_count} matching alumni"
-        
-        # Verify the count matches the actual alumni list length
-        assert response.count == len(response.alumni) if len(response.alumni) > 0 else response.count >= 0
-    
-    @given(
-        location=st.sampled_from(["Bangalore", "Mumbai", "Delhi", "Hyderabad", "Pune"]),
-        num_matching=st.integers(min_value=1, max_value=10),
-        num_non_matching=st.integers(min_value=0, max_value=10)
+        for i in range(num_non_matching)
+    ])
+    
+    # Create parsed query for location
+    parsed_query = ParsedQuery(
+        intent="find_by_location",
+        entities={"location": location},
+        raw_query=f"Alumni in {location}"
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-    def test_location_queries_return_only_matching_alumni(
-        self, db_session, location, num_matching, num_non_matching
-    ):
-        """
-        **Feature: alumni-management-system, Property 35: Location queries return only matching alumni**
-        **Validates: Requirements 5.6**
-        
-        For any location L, a location query for L should return only alumni
-        where location equals L.
-        """
-        # Generate unique test ID to avoid collisions between Hypothesis examples
-        test_id = str(uuid.uuid4())[:8]
-        
-        # Create matching alumni
-        for i in range(num_matching):
-            create_alumni(
-                db_session,
-                roll_number=f"MATCH_{test_id}_{i}",
-                name=f"Match Alumni {i}",
-                location=location,
-                current_company="TestCorp",
-                batch="2020"
-            )
-        
-        # Create non-matching alumni with different locations
-        other_locations = ["Chennai", "Kolkata", "Gurgaon"]
-        for i in range(num_non_matching):
-            create_alumni(
-                db_session,
-                roll_number=f"NOMATCH_{test_id}_{i}",
-                name=f"NoMatch Alumni {i}",
-                location=other_locations[i % len(other_locations)],
-                current_company="TestCorp",
-                batch="2020"
+    
+    # Execute query
+    response = query_executor.execute(parsed_query)
+    
+    # Verify all results match the location (property holds regardless of count)
+    # The key property is that ALL returned alumni are in the specified location
+    assert response.count >= num_matching, f"Should have at least {num_matching} matching alumni"
+    assert len(response.alumni) >= num_matching
+    
+    # The critical property: ALL results must match the location
+    assert all(alumni["location"] == location for alumni in response.alumni), \
+        f"Expected location {location}, got {[(a['name'], a['location']) for a in response.alumni if a['location'] != location]}"
+
+
+@given(
+    intent=st.sampled_from([
+        "find_by_company", "find_by_batch", "find_by_title", 
+        "find_by_location", "count", "help"
+    ]),
+    has_results=st.booleans()
+)
+def test_chatbot_responses_include_both_text_and_table(
+    db_session, query_executor, intent, has_results
+):
+    """
+    **Feature: alumni-management-system, Property 36: Chatbot responses include both text and table**
+    **Validates: Requirements 5.7**
+    
+    For any successful query with results, the response should contain
+    both response text and a formatted table of alumni.
+    """
+    # Generate unique test ID to avoid collisions between Hypothesis examples
+    test_id = _next_test_id()
+    
+    # Create some alumni if we want results
+    if has_results and intent not in ["help", "count"]:
+        bulk_create_alumni(db_session, [
+            dict(
+                roll_number=f"RESPONSE_{test_id}_{i}",
+                name=f"Alumni {i}",
+                current_company="Google",
+                batch="2020",
+                current_designation="software engineer",
+                location="Bangalore",
             )
-        
-        # Create parsed query for location
-        parsed_query = ParsedQuery(
-            intent="find_by_location",
-            entities={"location": location},
-            raw_query=f"Alumni in {location}"
-        )
-        
-        # Execute query
-        executor = QueryExecutor(db_session)
-        response = executor.execute(parsed_query)
-        
-        # Verify all results match the location (property holds regardless of count)
-        # The key property is that ALL returned alumni are in the specified location
-        assert response.count >= num_matching, f"Should have at least {num_matching} matching alumni"
-        assert len(response.alumni) >= num_matching
-        
-        # The critical property: ALL results must match the location
-        for alumni in response.alumni:
-            assert alumni["location"] == location, \
-                f"Alumni {alumni['name']} has location {alumni['location']}, expected {location}"
-    
-    @given(
-        intent=st.sampled_from([
-            "find_by_company", "find_by_batch", "find_by_title", 
-            "find_by_location", "count", "help"
-        ]),
-        has_results=st.booleans()
+            for i in range(3)
+        ])
+    
+    # Build appropriate query
+    entities = {}
+    if intent == "find_by_company":
+        entities = {"company": "Google"}
+    elif intent == "find_by_batch":
+        entities = {"batch": "2020"}
+    elif intent == "find_by_title":
+        entities = {"title": "software engineer"}
+    elif intent == "find_by_location":
+        entities = {"location": "Bangalore"}
+    
+    parsed_query = ParsedQuery(
+        intent=intent,
+        entities=entities,
+        raw_query="Test query"
     )
-    @settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-    def test_chatbot_responses_include_both_text_and_table(
-        self, db_session, intent, has_results
-    ):
-        """
-        **Feature: alumni-management-system, Property 36: Chatbot responses include both text and table**
-        **Validates: Requirements 5.7**
-        
-        For any successful query with results, the response should contain
-        both response text and a formatted table of alumni.
-        """
-        # Generate unique test ID to avoid collisions between Hypothesis examples
-        test_id = str(uuid.uuid4())[:8]
-        
-        # Create some alumni if we want results
-        if has_results and intent not in ["help", "count"]:
-            for i in range(3):
-                create_alumni(
-                    db_session,
-                    roll_number=f"RESPONSE_{test_id}_{i}",
-                    name=f"Alumni {i}",
-                    current_company="Google",
-                    batch="2020",
-                    current_designation="software engineer",
-                    location="Bangalore"
-                )
-        
-        # Build appropriate query
-        entities = {}
-        if intent == "find_by_company":
-            entities = {"company": "Google"}
-        elif intent == "find_by_batch":
-            entities = {"batch": "2020"}
-        elif intent == "find_by_title":
-            entities = {"title": "software engineer"}
-        elif intent == "find_by_location":
-            entities = {"location": "Bangalore"}
-        
-        parsed_query = ParsedQuery(
-            intent=intent,
-            entities=entities,
-            raw_query="Test query"
-        )
-        
-        # Execute query
-        executor = QueryExecutor(db_session)
-        response = executor.execute(parsed_query)
-        
-        # Verify response structure
-        assert isinstance(response.response, str)
-        assert len(response.response) > 0
-        assert isinstance(response.alumni, list)
-        assert isinstance(response.count, int)
-        
-        # For queries with results, verify both text and data are present
-        if has_results and intent not in ["help", "count"]:
-            assert response.count > 0
-            assert len(response.alumni) > 0
-            # Response text should mention the count
-            assert str(response.count) in response.response or "found" in response.response.lower()
-        
-        # For help and count, alumni list should be empty
-        if intent in ["help", "count"]:
-            assert len(response.alumni) == 0
+    
+    # Execute query
+    response = query_executor.execute(parsed_query)
+    
+    # Verify response structure
+    assert isinstance(response.response, str)
+    assert len(response.response) > 0
+    assert isinstance(response.alumni, list)
+    assert isinstance(response.count, int)
+    
+    # For queries with results, verify both text and data are present
+    if has_results and intent not in ["help", "count"]:
+        assert response.count > 0
+        assert len(response.alumni) > 0
+        # Response text should mention the count
+        assert str(response.count) in response.response or "found" in response.response.lower()
+    
+    # For help and count, alumni list should be empty
+    if intent in ["help", "count"]:
+        assert len(response.alumni) == 0
@@ -8,24 +8,34 @@ Tests correctness properties for alumni database operations including:
 - Cascade deletion
 """
 
-import time
+import itertools
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
-from hypothesis import HealthCheck, example, given, settings
+from hypothesis import example, given
 from hypothesis import strategies as st
-from uuid import uuid4
 
 from alumni_system.database.crud import (
+    count_education_history,
+    count_job_history,
     create_alumni,
-    create_education_history,
-    create_job_history,
     delete_alumni,
     get_all_alumni,
     get_alumni_by_roll_number,
-    get_education_history_by_alumni,
+    get_alumni_count,
     get_job_history_by_alumni,
 )
+from alumni_system.database.models import Alumni
+from tests.db_helpers import (
+    bulk_create_education_history,
+    bulk_create_job_history,
+    insert_alumni,
+)
+from tests.strategies import ALUMNI_STRATEGY
+
+# Unique 20-character roll numbers for this process
+_ROLL_COUNTER = itertools.count()
 
 
 # =============================================================================
@@ -33,19 +43,6 @@ from alumni_system.database.crud import (
 # =============================================================================
 
 
-@st.composite
-def alumni_data(draw):
-    """Generate random alumni data."""
-    return {
-        'roll_number': draw(st.text(min_size=5, max_size=20, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789')),
-        'name': draw(st.text(min_size=3, max_size=50, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ')),
-        'batch': draw(st.text(min_size=4, max_size=10, alphabet='0123456789')),
-        'current_company': draw(st.text(min_size=3, max_size=50, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ')),
-        'current_designation': draw(st.text(min_size=3, max_size=50, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ')),
-        'location': draw(st.text(min_size=3, max_size=50, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ')),
-    }
-
-
 @st.composite
 def job_history_data(draw):
     """Generate random job history data."""
@@ -66,14 +63,32 @@ def education_history_data(draw):
     }
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _make_alumni_with_children(db_session, data, num_jobs, num_education):
+    """Insert an alumni with num_jobs job and num_education education records; return its id."""
+    alumni_id = insert_alumni(db_session, **data).id
+    bulk_create_job_history(db_session, alumni_id, [
+        {'company_name': f'Company {i}', 'designation': f'Role {i}', 'is_current': i == 0}
+        for i in range(num_jobs)
+    ])
+    bulk_create_education_history(db_session, alumni_id, [
+        {'institution_name': f'University {i}', 'degree': f'Degree {i}', 'field_of_study': f'Field {i}'}
+        for i in range(num_education)
+    ])
+    return alumni_id
+
+
 # =============================================================================
 # Property Tests
 # =============================================================================
 
 
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-@given(data=alumni_data())
-def test_property_11_upsert_prevents_duplicates(db_session, data):
+@given(data=ALUMNI_STRATEGY)
+def test_property_11_upsert_prevents_duplicates(isolated_db_session, data):
     """
     **Feature: alumni-management-system, Property 11: Upsert prevents duplicates**
     **Validates: Requirements 2.2**
@@ -81,34 +96,34 @@ def test_property_11_upsert_prevents_duplicates(db_session, data):
     For any alumni record with roll number R, inserting a second record with the 
     same roll number R should update the existing record rather than creating a duplicate.
     """
-    # Create first alumni record
-    alumni1 = create_alumni(db_session, **data)
-    first_id = alumni1.id
-    first_created_at = alumni1.created_at
+    with isolated_db_session() as db_session:
+        # Create first alumni record
+        alumni1 = create_alumni(db_session, **data)
+        first_id = alumni1.id
+        first_created_at = alumni1.created_at
     
-    # Modify data and create again with same roll_number
-    modified_data = data.copy()
-    modified_data['name'] = 'Updated Name'
-    modified_data['current_company'] = 'Updated Company'
+        # Modify data and create again with same roll_number
+        modified_data = data.copy()
+        modified_data['name'] = 'Updated Name'
+        modified_data['current_company'] = 'Updated Company'
     
-    alumni2 = create_alumni(db_session, **modified_data)
+        alumni2 = create_alumni(db_session, **modified_data)
     
-    # Should be the same record (same ID)
-    assert alumni2.id == first_id, "Upsert should update existing record, not create new one"
+        # Should be the same record (same ID)
+        assert alumni2.id == first_id, "Upsert should update existing record, not create new one"
     
-    # Should have updated values
-    assert alumni2.name == 'Updated Name', "Upsert should update name"
-    assert alumni2.current_company == 'Updated Company', "Upsert should update company"
+        # Should have updated values
+        assert alumni2.name == 'Updated Name', "Upsert should update name"
+        assert alumni2.current_company == 'Updated Company', "Upsert should update company"
     
-    # Verify only one record exists with this roll_number
-    all_with_roll = get_alumni_by_roll_number(db_session, data['roll_number'])
-    assert all_with_roll is not None
-    assert all_with_roll.id == first_id, "Only one record should exist for this roll_number"
+        # Verify only one record exists with this roll_number
+        all_with_roll = get_alumni_by_roll_number(db_session, data['roll_number'])
+        assert all_with_roll is not None
+        assert all_with_roll.id == first_id, "Only one record should exist for this roll_number"
 
 
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-@given(data=alumni_data())
-def test_property_14_timestamp_update_preserves_creation_time(db_session, data):
+@given(data=ALUMNI_STRATEGY)
+def test_property_14_timestamp_update_preserves_creation_time(isolated_db_session, data):
     """
     **Feature: alumni-management-system, Property 14: Timestamp update preserves creation time**
     **Validates: Requirements 2.5**
@@ -116,34 +131,34 @@ def test_property_14_timestamp_update_preserves_creation_time(db_session, data):
     For any alumni record with created_at timestamp T1, after any update operation, 
     created_at should still equal T1 and updated_at should be greater than T1.
     """
-    # Create alumni record
-    alumni = create_alumni(db_session, **data)
-    original_created_at = alumni.created_at
+    with isolated_db_session() as db_session:
+        # Create alumni record
+        alumni = create_alumni(db_session, **data)
+        original_created_at = alumni.created_at
     
-    # Small delay to ensure time difference
-    time.sleep(0.01)
+        # Update the record using upsert, one second later on the CRUD
+        # layer's clock instead of sleeping until the clock moves
+        modified_data = data.copy()
+        modified_data['current_company'] = 'New Company After Update'
     
-    # Update the record using upsert
-    modified_data = data.copy()
-    modified_data['current_company'] = 'New Company After Update'
+        with patch('alumni_system.database.crud.datetime') as mock_datetime:
+            mock_datetime.utcnow.return_value = original_created_at + timedelta(seconds=1)
+            updated_alumni = create_alumni(db_session, **modified_data)
     
-    updated_alumni = create_alumni(db_session, **modified_data)
+        # created_at should be preserved
+        assert updated_alumni.created_at == original_created_at, \
+            "created_at timestamp should be preserved during update"
     
-    # created_at should be preserved
-    assert updated_alumni.created_at == original_created_at, \
-        "created_at timestamp should be preserved during update"
-    
-    # updated_at should be greater than created_at
-    assert updated_alumni.updated_at >= original_created_at, \
-        "updated_at should be greater than or equal to created_at"
+        # updated_at should be greater than created_at
+        assert updated_alumni.updated_at > original_created_at, \
+            "updated_at should be greater than created_at"
 
 
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
 @given(
-    data=alumni_data(),
+    data=ALUMNI_STRATEGY,
     batch_filter=st.text(min_size=4, max_size=10, alphabet='0123456789')
 )
-def test_property_16_batch_filter_returns_only_matching_alumni(db_session, data, batch_filter):
+def test_property_16_batch_filter_returns_only_matching_alumni(isolated_db_session, data, batch_filter):
     """
     **Feature: alumni-management-system, Property 16: Batch filter returns only matching alumni**
     **Validates: Requirements 2.7**
@@ -151,38 +166,38 @@ def test_property_16_batch_filter_returns_only_matching_alumni(db_session, data,
     For any batch value B, filtering alumni by batch B should return only alumni 
     where batch equals B.
     """
-    # Create alumni with specific batch
-    data['batch'] = batch_filter
-    alumni1 = create_alumni(db_session, **data)
+    with isolated_db_session() as db_session:
+        # Create alumni with specific batch
+        data['batch'] = batch_filter
+        alumni1 = create_alumni(db_session, **data)
     
-    # Create another alumni with different batch
-    data2 = data.copy()
-    data2['roll_number'] = data['roll_number'] + '_different'
-    data2['batch'] = 'DifferentBatch123'
-    alumni2 = create_alumni(db_session, **data2)
+        # Create another alumni with different batch
+        data2 = data.copy()
+        data2['roll_number'] = data['roll_number'] + '_different'
+        data2['batch'] = 'DifferentBatch123'
+        alumni2 = create_alumni(db_session, **data2)
     
-    # Filter by the specific batch
-    filtered_alumni = get_all_alumni(db_session, batch=batch_filter)
+        # Filter by the specific batch
+        filtered_alumni = get_all_alumni(db_session, batch=batch_filter)
     
-    # All returned alumni should have the specified batch
-    for alumni in filtered_alumni:
-        assert alumni.batch == batch_filter, \
-            f"Filtered alumni should have batch={batch_filter}, got {alumni.batch}"
+        # All returned alumni should have the specified batch
+        for alumni in filtered_alumni:
+            assert alumni.batch == batch_filter, \
+                f"Filtered alumni should have batch={batch_filter}, got {alumni.batch}"
     
-    # Should include alumni1 but not alumni2
-    filtered_ids = [a.id for a in filtered_alumni]
-    assert alumni1.id in filtered_ids, "Should include alumni with matching batch"
-    assert alumni2.id not in filtered_ids, "Should not include alumni with different batch"
+        # Should include alumni1 but not alumni2
+        filtered_ids = [a.id for a in filtered_alumni]
+        assert alumni1.id in filtered_ids, "Should include alumni with matching batch"
+        assert alumni2.id not in filtered_ids, "Should not include alumni with different batch"
 
 
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
 @given(
-    data=alumni_data(),
+    data=ALUMNI_STRATEGY,
     num_jobs=st.integers(min_value=1, max_value=5),
     num_education=st.integers(min_value=1, max_value=3)
 )
 def test_property_17_cascade_deletion_removes_all_related_records(
-    db_session, data, num_jobs, num_education
+    isolated_db_session, data, num_jobs, num_education
 ):
     """
     **Feature: alumni-management-system, Property 17: Cascade deletion removes all related records**
@@ -191,57 +206,38 @@ def test_property_17_cascade_deletion_removes_all_related_records(
     For any alumni with N job history records and M education history records, 
     deleting that alumni should result in all N+M related records also being deleted.
     """
-    # Create alumni
-    alumni = create_alumni(db_session, **data)
-    alumni_id = alumni.id
-    
-    # Create job history records
-    for i in range(num_jobs):
-        job_data = {
-            'company_name': f'Company {i}',
-            'designation': f'Role {i}',
-            'is_current': i == 0,
-        }
-        create_job_history(db_session, alumni_id, **job_data)
-    
-    # Create education history records
-    for i in range(num_education):
-        edu_data = {
-            'institution_name': f'University {i}',
-            'degree': f'Degree {i}',
-            'field_of_study': f'Field {i}',
-        }
-        create_education_history(db_session, alumni_id, **edu_data)
+    with isolated_db_session() as db_session:
+        # Create alumni with job and education history records
+        alumni_id = _make_alumni_with_children(db_session, data, num_jobs, num_education)
     
-    # Verify records exist
-    job_records_before = get_job_history_by_alumni(db_session, alumni_id)
-    edu_records_before = get_education_history_by_alumni(db_session, alumni_id)
+        # Verify records exist
+        job_count_before = count_job_history(db_session, alumni_id)
+        edu_count_before = count_education_history(db_session, alumni_id)
     
-    assert len(job_records_before) == num_jobs, \
-        f"Should have {num_jobs} job records before deletion"
-    assert len(edu_records_before) == num_education, \
-        f"Should have {num_education} education records before deletion"
+        assert job_count_before == num_jobs, \
+            f"Should have {num_jobs} job records before deletion"
+        assert edu_count_before == num_education, \
+            f"Should have {num_education} education records before deletion"
     
-    # Delete alumni
-    delete_result = delete_alumni(db_session, alumni_id)
-    assert delete_result is True, "Delete operation should succeed"
+        # Delete alumni
+        delete_result = delete_alumni(db_session, alumni_id)
+        assert delete_result is True, "Delete operation should succeed"
     
-    # Verify all related records are deleted (cascade)
-    job_records_after = get_job_history_by_alumni(db_session, alumni_id)
-    edu_records_after = get_education_history_by_alumni(db_session, alumni_id)
+        # Verify all related records are deleted (cascade)
+        job_count_after = count_job_history(db_session, alumni_id)
+        edu_count_after = count_education_history(db_session, alumni_id)
     
-    assert len(job_records_after) == 0, \
-        "All job history records should be deleted via cascade"
-    assert len(edu_records_after) == 0, \
-        "All education history records should be deleted via cascade"
+        assert job_count_after == 0, \
+            "All job history records should be deleted via cascade"
+        assert edu_count_after == 0, \
+            "All education history records should be deleted via cascade"
 
 
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
 @given(
     name=st.text(min_size=3, max_size=50, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '),
     num_jobs=st.integers(min_value=0, max_value=10)
 )
-def test_property_12_job_history_count_invariant(db_session, name, num_jobs):
+def test_property_12_job_history_count_invariant(isolated_db_session, name, num_jobs):
     """
     **Feature: alumni-management-system, Property 12: Job history count invariant**
     **Validates: Requirements 2.3**
@@ -249,38 +245,35 @@ def test_property_12_job_history_count_invariant(db_session, name, num_jobs):
     For any alumni with N job history records stored, querying that alumni's 
     job history should return exactly N records.
     """
-    # Create alumni with unique roll number (using UUID to ensure uniqueness across examples)
-    alumni_data = {
-        'roll_number': str(uuid4()),  # Generate unique ID for each example
-        'name': name,
-        'batch': '2020',
-    }
-    alumni = create_alumni(db_session, **alumni_data)
-    alumni_id = alumni.id
-    
-    # Create N job history records
-    for i in range(num_jobs):
-        job_data = {
-            'company_name': f'Company {i}',
-            'designation': f'Role {i}',
-            'is_current': i == 0,
+    with isolated_db_session() as db_session:
+        # Create alumni with unique roll number
+        alumni_data = {
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
+            'name': name,
+            'batch': '2020',
         }
-        create_job_history(db_session, alumni_id, **job_data)
+        alumni = insert_alumni(db_session, **alumni_data)
+        alumni_id = alumni.id
     
-    # Query job history
-    retrieved_jobs = get_job_history_by_alumni(db_session, alumni_id)
+        # Create N job history records
+        bulk_create_job_history(db_session, alumni_id, [
+            {'company_name': f'Company {i}', 'designation': f'Role {i}', 'is_current': i == 0}
+            for i in range(num_jobs)
+        ])
     
-    # Count should match exactly
-    assert len(retrieved_jobs) == num_jobs, \
-        f"Expected {num_jobs} job history records, but got {len(retrieved_jobs)}"
+        # Count job history in SQL
+        job_count = count_job_history(db_session, alumni_id)
+    
+        # Count should match exactly
+        assert job_count == num_jobs, \
+            f"Expected {num_jobs} job history records, but got {job_count}"
 
 
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
 @given(
     name=st.text(min_size=3, max_size=50, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '),
     num_education=st.integers(min_value=0, max_value=10)
 )
-def test_property_13_education_history_count_invariant(db_session, name, num_education):
+def test_property_13_education_history_count_invariant(isolated_db_session, name, num_education):
     """
     **Feature: alumni-management-system, Property 13: Education history count invariant**
     **Validates: Requirements 2.4**
@@ -288,38 +281,35 @@ def test_property_13_education_history_count_invariant(db_session, name, num_edu
     For any alumni with N education history records stored, querying that alumni's 
     education history should return exactly N records.
     """
-    # Create alumni with unique roll number (using UUID to ensure uniqueness across examples)
-    alumni_data = {
-        'roll_number': str(uuid4()),  # Generate unique ID for each example
-        'name': name,
-        'batch': '2020',
-    }
-    alumni = create_alumni(db_session, **alumni_data)
-    alumni_id = alumni.id
-    
-    # Create N education history records
-    for i in range(num_education):
-        edu_data = {
-            'institution_name': f'University {i}',
-            'degree': f'Degree {i}',
-            'field_of_study': f'Field {i}',
+    with isolated_db_session() as db_session:
+        # Create alumni with unique roll number
+        alumni_data = {
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
+            'name': name,
+            'batch': '2020',
         }
-        create_education_history(db_session, alumni_id, **edu_data)
+        alumni = insert_alumni(db_session, **alumni_data)
+        alumni_id = alumni.id
     
-    # Query education history
-    retrieved_education = get_education_history_by_alumni(db_session, alumni_id)
+        # Create N education history records
+        bulk_create_education_history(db_session, alumni_id, [
+            {'institution_name': f'University {i}', 'degree': f'Degree {i}', 'field_of_study': f'Field {i}'}
+            for i in range(num_education)
+        ])
     
-    # Count should match exactly
-    assert len(retrieved_education) == num_education, \
-        f"Expected {num_education} education history records, but got {len(retrieved_education)}"
+        # Count education history in SQL
+        education_count = count_education_history(db_session, alumni_id)
+    
+        # Count should match exactly
+        assert education_count == num_education, \
+            f"Expected {num_education} education history records, but got {education_count}"
 
 
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
 @given(
     name=st.text(min_size=3, max_size=50, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '),
     num_jobs=st.integers(min_value=2, max_value=10)
 )
-def test_property_30_job_history_is_sorted_by_date_descending(db_session, name, num_jobs):
+def test_property_30_job_history_is_sorted_by_date_descending(isolated_db_session, name, num_jobs):
     """
     **Feature: alumni-management-system, Property 30: Job history is sorted by date descending**
     **Validates: Requirements 4.8, 10.4**
@@ -327,48 +317,39 @@ def test_property_30_job_history_is_sorted_by_date_descending(db_session, name,
     For any alumni's job history display, each record should have a start_date 
     less than or equal to the previous record's start_date.
     """
-    # Create alumni with unique roll number (using UUID to ensure uniqueness across examples)
-    alumni_data = {
-        'roll_number': str(uuid4()),  # Generate unique ID for each example
-        'name': name,
-        'batch': '2020',
-    }
-    alumni = create_alumni(db_session, **alumni_data)
-    alumni_id = alumni.id
-    
-    # Create N job history records with different start dates
-    # Start from a base date and add days for each job
-    base_date = datetime(2020, 1, 1)
-    for i in range(num_jobs):
-        # Create jobs with increasing dates (older jobs have earlier dates)
-        start_date = base_date + timedelta(days=i * 365)
-        job_data = {
-            'company_name': f'Company {i}',
-            'designation': f'Role {i}',
-            'start_date': start_date,
-            'is_current': i == (num_jobs - 1),  # Last job is current
+    with isolated_db_session() as db_session:
+        # Create alumni with unique roll number
+        alumni_data = {
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
+            'name': name,
+            'batch': '2020',
         }
-        create_job_history(db_session, alumni_id, **job_data)
-    
-    # Query job history
-    retrieved_jobs = get_job_history_by_alumni(db_session, alumni_id)
-    
-    # Verify sorting: each job's start_date should be >= the next job's start_date
-    # (descending order means most recent first)
-    for i in range(len(retrieved_jobs) - 1):
-        current_job = retrieved_jobs[i]
-        next_job = retrieved_jobs[i + 1]
-        
-        # Both should have start_date
-        assert current_job.start_date is not None, \
-            f"Job {i} should have a start_date"
-        assert next_job.start_date is not None, \
-            f"Job {i+1} should have a start_date"
-        
-        # Current job should have start_date >= next job's start_date (descending order)
-        assert current_job.start_date >= next_job.start_date, \
-            f"Job history not sorted correctly: job {i} start_date {current_job.start_date} " \
-            f"should be >= job {i+1} start_date {next_job.start_date}"
+        alumni = insert_alumni(db_session, **alumni_data)
+        alumni_id = alumni.id
+    
+        # Create N job history records with different start dates
+        # Start from a base date and add days for each job
+        # (older jobs have earlier dates; the last job is current)
+        base_date = datetime(2020, 1, 1)
+        bulk_create_job_history(db_session, alumni_id, [
+            {
+                'company_name': f'Company {i}',
+                'designation': f'Role {i}',
+                'start_date': base_date + timedelta(days=i * 365),
+                'is_current': i == (num_jobs - 1),
+            }
+            for i in range(num_jobs)
+        ])
+    
+        # Query job history
+        retrieved_jobs = get_job_history_by_alumni(db_session, alumni_id)
+    
+        # Verify sorting: start dates should be in descending order
+        # (most recent first), compared against one Python sort
+        start_dates = [job.start_date for job in retrieved_jobs]
+        assert None not in start_dates, "Every job should have a start_date"
+        assert start_dates == sorted(start_dates, reverse=True), \
+            f"Job history not sorted by start_date descending: {start_dates}"
 
 
 # =============================================================================
@@ -376,9 +357,8 @@ def test_property_30_job_history_is_sorted_by_date_descending(db_session, name,
 # =============================================================================
 
 
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-@given(data=alumni_data())
-def test_property_45_add_form_creates_exactly_one_record(db_session, data):
+@given(data=ALUMNI_STRATEGY)
+def test_property_45_add_form_creates_exactly_one_record(isolated_db_session, data):
     """
     **Feature: alumni-management-system, Property 45: Add form creates exactly one record**
     **Validates: Requirements 11.1**
@@ -386,34 +366,32 @@ def test_property_45_add_form_creates_exactly_one_record(db_session, data):
     For any valid alumni data submitted through the add form, exactly one new 
     alumni record should be created.
     """
-    # Ensure unique roll number for this test
-    data['roll_number'] = str(uuid4())
+    with isolated_db_session() as db_session:
+        # Ensure unique roll number for this test
+        data['roll_number'] = f"R{next(_ROLL_COUNTER):019d}"
     
-    # Count records before
-    all_alumni_before = get_all_alumni(db_session, skip=0, limit=10000)
-    count_before = len(all_alumni_before)
+        # Count records before
+        count_before = get_alumni_count(db_session)
     
-    # Create alumni (simulating add form submission)
-    new_alumni = create_alumni(db_session, **data)
+        # Create alumni (simulating add form submission)
+        new_alumni = create_alumni(db_session, **data)
     
-    # Count records after
-    all_alumni_after = get_all_alumni(db_session, skip=0, limit=10000)
-    count_after = len(all_alumni_after)
+        # Count records after
+        count_after = get_alumni_count(db_session)
     
-    # Exactly one record should be added
-    assert count_after == count_before + 1, \
-        f"Expected exactly 1 new record, but count changed from {count_before} to {count_after}"
+        # Exactly one record should be added
+        assert count_after == count_before + 1, \
+            f"Expected exactly 1 new record, but count changed from {count_before} to {count_after}"
     
-    # Verify the created record exists
-    retrieved = get_alumni_by_roll_number(db_session, data['roll_number'])
-    assert retrieved is not None, "Created alumni should be retrievable"
-    assert retrieved.id == new_alumni.id, "Retrieved alumni should match created alumni"
-    assert retrieved.name == data['name'], "Retrieved alumni should have correct name"
+        # Verify the created record exists
+        retrieved = get_alumni_by_roll_number(db_session, data['roll_number'])
+        assert retrieved is not None, "Created alumni should be retrievable"
+        assert retrieved.id == new_alumni.id, "Retrieved alumni should match created alumni"
+        assert retrieved.name == data['name'], "Retrieved alumni should have correct name"
 
 
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-@given(data=alumni_data())
-def test_property_46_duplicate_roll_numbers_are_rejected(db_session, data):
+@given(data=ALUMNI_STRATEGY)
+def test_property_46_duplicate_roll_numbers_are_rejected(isolated_db_session, data):
     """
     **Feature: alumni-management-system, Property 46: Duplicate roll numbers are rejected**
     **Validates: Requirements 11.2**
@@ -421,40 +399,35 @@ def test_property_46_duplicate_roll_numbers_are_rejected(db_session, data):
     For any attempt to add an alumni with a roll number that already exists, 
     the operation should be rejected with an error.
     """
-    # Create first alumni
-    alumni1 = create_alumni(db_session, **data)
-    first_id = alumni1.id
-    first_name = alumni1.name
-    
-    # Try to create another alumni with same roll_number but different data
-    # Note: The current implementation uses upsert, so it updates instead of rejecting
-    # This test verifies that duplicate roll numbers result in update, not a new record
-    modified_data = data.copy()
-    modified_data['name'] = 'Different Name'
-    modified_data['current_company'] = 'Different Company'
-    
-    alumni2 = create_alumni(db_session, **modified_data)
-    
-    # Should be the same record (upsert behavior)
-    assert alumni2.id == first_id, \
-        "Duplicate roll number should update existing record, not create new one"
-    
-    # Verify only one record exists with this roll_number
-    all_with_roll = get_alumni_by_roll_number(db_session, data['roll_number'])
-    assert all_with_roll is not None
-    assert all_with_roll.id == first_id, \
-        "Only one record should exist for this roll_number"
-    
-    # Count total records with this roll number (should be 1)
-    all_alumni = get_all_alumni(db_session, skip=0, limit=10000)
-    matching_roll = [a for a in all_alumni if a.roll_number == data['roll_number']]
-    assert len(matching_roll) == 1, \
-        f"Expected exactly 1 record with roll_number {data['roll_number']}, found {len(matching_roll)}"
-
-
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
-@given(data=alumni_data())
-def test_property_47_edit_form_round_trip_preserves_data(db_session, data):
+    with isolated_db_session() as db_session:
+        # Create first alumni
+        alumni1 = create_alumni(db_session, **data)
+        first_id = alumni1.id
+        first_name = alumni1.name
+    
+        # Try to create another alumni with same roll_number but different data
+        # Note: The current implementation uses upsert, so it updates instead of rejecting
+        # This test verifies that duplicate roll numbers result in update, not a new record
+        modified_data = data.copy()
+        modified_data['name'] = 'Different Name'
+        modified_data['current_company'] = 'Different Company'
+    
+        alumni2 = create_alumni(db_session, **modified_data)
+    
+        # Should be the same record (upsert behavior)
+        assert alumni2.id == first_id, \
+            "Duplicate roll number should update existing record, not create new one"
+    
+        # Count total records with this roll number (should be 1)
+        matching_roll = db_session.query(Alumni).filter(
+            Alumni.roll_number == data['roll_number']
+        ).count()
+        assert matching_roll == 1, \
+            f"Expected exactly 1 record with roll_number {data['roll_number']}, found {matching_roll}"
+
+
+@given(data=ALUMNI_STRATEGY)
+def test_property_47_edit_form_round_trip_preserves_data(isolated_db_session, data):
     """
     **Feature: alumni-management-system, Property 47: Edit form round-trip preserves data**
     **Validates: Requirements 11.3**
@@ -462,38 +435,40 @@ def test_property_47_edit_form_round_trip_preserves_data(db_session, data):
     For any alumni record loaded into the edit form, the form fields should 
     contain the same values as the database record.
     """
-    # Create alumni with unique roll number
-    data['roll_number'] = str(uuid4())
-    alumni = create_alumni(db_session, **data)
-    alumni_id = alumni.id
-    
-    # Simulate loading alumni for edit form (retrieve by ID)
-    loaded_alumni = get_alumni_by_roll_number(db_session, data['roll_number'])
-    
-    # Verify all fields match original data
-    assert loaded_alumni is not None, "Alumni should be retrievable for editing"
-    assert loaded_alumni.id == alumni_id, "Loaded alumni should have correct ID"
-    assert loaded_alumni.roll_number == data['roll_number'], \
-        "Roll number should be preserved"
-    assert loaded_alumni.name == data['name'], \
-        "Name should be preserved"
-    assert loaded_alumni.batch == data['batch'], \
-        "Batch should be preserved"
-    assert loaded_alumni.current_company == data['current_company'], \
-        "Current company should be preserved"
-    assert loaded_alumni.current_designation == data['current_designation'], \
-        "Current designation should be preserved"
-    assert loaded_alumni.location == data['location'], \
-        "Location should be preserved"
-
-
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    with isolated_db_session() as db_session:
+        # Create alumni with unique roll number
+        data['roll_number'] = f"R{next(_ROLL_COUNTER):019d}"
+        alumni = insert_alumni(db_session, **data)
+        alumni_id = alumni.id
+    
+        # Simulate loading alumni for edit form (retrieve by ID); expiring
+        # the object makes the primary-key get reload it from the database
+        db_session.expire(alumni)
+        loaded_alumni = db_session.get(Alumni, alumni_id)
+    
+        # Verify all fields match original data
+        assert loaded_alumni is not None, "Alumni should be retrievable for editing"
+        assert loaded_alumni.id == alumni_id, "Loaded alumni should have correct ID"
+        assert loaded_alumni.roll_number == data['roll_number'], \
+            "Roll number should be preserved"
+        assert loaded_alumni.name == data['name'], \
+            "Name should be preserved"
+        assert loaded_alumni.batch == data['batch'], \
+            "Batch should be preserved"
+        assert loaded_alumni.current_company == data['current_company'], \
+            "Current company should be preserved"
+        assert loaded_alumni.current_designation == data['current_designation'], \
+            "Current designation should be preserved"
+        assert loaded_alumni.location == data['location'], \
+            "Location should be preserved"
+
+
 @given(
-    original_data=alumni_data(),
+    original_data=ALUMNI_STRATEGY,
     updated_name=st.text(min_size=3, max_size=50, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz '),
     updated_company=st.text(min_size=3, max_size=50, alphabet='ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ')
 )
-def test_property_48_edit_form_updates_persist(db_session, original_data, updated_name, updated_company):
+def test_property_48_edit_form_updates_persist(isolated_db_session, original_data, updated_name, updated_company):
     """
     **Feature: alumni-management-system, Property 48: Edit form updates persist**
     **Validates: Requirements 11.4**
@@ -501,43 +476,44 @@ def test_property_48_edit_form_updates_persist(db_session, original_data, update
     For any alumni record edited through the form, the database should contain 
     the new values after submission.
     """
-    # Create alumni with unique roll number
-    original_data['roll_number'] = str(uuid4())
-    alumni = create_alumni(db_session, **original_data)
-    alumni_id = alumni.id
-    
-    # Simulate edit form submission with updated values
-    updated_data = original_data.copy()
-    updated_data['name'] = updated_name
-    updated_data['current_company'] = updated_company
-    
-    # Update using upsert (same roll_number)
-    updated_alumni = create_alumni(db_session, **updated_data)
-    
-    # Verify updates persisted
-    assert updated_alumni.id == alumni_id, "Should update same record"
-    assert updated_alumni.name == updated_name, \
-        "Updated name should persist in database"
-    assert updated_alumni.current_company == updated_company, \
-        "Updated company should persist in database"
-    
-    # Verify by retrieving again
-    retrieved = get_alumni_by_roll_number(db_session, original_data['roll_number'])
-    assert retrieved is not None, "Updated alumni should be retrievable"
-    assert retrieved.name == updated_name, \
-        "Retrieved alumni should have updated name"
-    assert retrieved.current_company == updated_company, \
-        "Retrieved alumni should have updated company"
-
-
-@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+    with isolated_db_session() as db_session:
+        # Create alumni with unique roll number
+        original_data['roll_number'] = f"R{next(_ROLL_COUNTER):019d}"
+        alumni = insert_alumni(db_session, **original_data)
+        alumni_id = alumni.id
+    
+        # Simulate edit form submission with updated values
+        updated_data = original_data.copy()
+        updated_data['name'] = updated_name
+        updated_data['current_company'] = updated_company
+    
+        # Update using upsert (same roll_number)
+        updated_alumni = create_alumni(db_session, **updated_data)
+    
+        # Verify updates persisted
+        assert updated_alumni.id == alumni_id, "Should update same record"
+        assert updated_alumni.name == updated_name, \
+            "Updated name should persist in database"
+        assert updated_alumni.current_company == updated_company, \
+            "Updated company should persist in database"
+    
+        # Verify by retrieving again, reloading from the database
+        db_session.expire(updated_alumni)
+        retrieved = db_session.get(Alumni, alumni_id)
+        assert retrieved is not None, "Updated alumni should be retrievable"
+        assert retrieved.name == updated_name, \
+            "Retrieved alumni should have updated name"
+        assert retrieved.current_company == updated_company, \
+            "Retrieved alumni should have updated company"
+
+
 @given(
-    data=alumni_data(),
+    data=ALUMNI_STRATEGY,
     num_jobs=st.integers(min_value=1, max_value=5),
     num_education=st.integers(min_value=1, max_value=3)
 )
 def test_property_49_delete_removes_all_related_records(
-    db_session, data, num_jobs, num_education
+    isolated_db_session, data, num_jobs, num_education
 ):
     """
     **Feature: alumni-management-system, Property 49: Delete removes all related records**
@@ -546,51 +522,33 @@ def test_property_49_delete_removes_all_related_records(
     For any alumni with associated job history and education history, deleting 
     the alumni should remove all related records.
     """
-    # Create alumni with unique roll number
-    data['roll_number'] = str(uuid4())
-    alumni = create_alumni(db_session, **data)
-    alumni_id = alumni.id
-    
-    # Create job history records
-    for i in range(num_jobs):
-        job_data = {
-            'company_name': f'Company {i}',
-            'designation': f'Role {i}',
-            'is_current': i == 0,
-        }
-        create_job_history(db_session, alumni_id, **job_data)
-    
-    # Create education history records
-    for i in range(num_education):
-        edu_data = {
-            'institution_name': f'University {i}',
-            'degree': f'Degree {i}',
-            'field_of_study': f'Field {i}',
-        }
-        create_education_history(db_session, alumni_id, **edu_data)
-    
-    # Verify records exist before deletion
-    job_records_before = get_job_history_by_alumni(db_session, alumni_id)
-    edu_records_before = get_education_history_by_alumni(db_session, alumni_id)
-    
-    assert len(job_records_before) == num_jobs, \
-        f"Should have {num_jobs} job records before deletion"
-    assert len(edu_records_before) == num_education, \
-        f"Should have {num_education} education records before deletion"
-    
-    # Delete alumni (simulating delete form action)
-    delete_result = delete_alumni(db_session, alumni_id)
-    assert delete_result is True, "Delete operation should succeed"
-    
-    # Verify alumni is deleted
-    deleted_alumni = get_alumni_by_roll_number(db_session, data['roll_number'])
-    assert deleted_alumni is None, "Alumni should be deleted from database"
-    
-    # Verify all related records are deleted (cascade)
-    job_records_after = get_job_history_by_alumni(db_session, alumni_id)
-    edu_records_after = get_education_history_by_alumni(db_session, alumni_id)
-    
-    assert len(job_records_after) == 0, \
-        "All job history records should be deleted via cascade"
-    assert len(edu_records_after) == 0, \
-        "All education history records should be deleted via cascade"
+    with isolated_db_session() as db_session:
+        # Create alumni (unique roll number) with job and education history records
+        data['roll_number'] = f"R{next(_ROLL_COUNTER):019d}"
+        alumni_id = _make_alumni_with_children(db_session, data, num_jobs, num_education)
+    
+        # Verify records exist before deletion
+        job_count_before = count_job_history(db_session, alumni_id)
+        edu_count_before = count_education_history(db_session, alumni_id)
+    
+        assert job_count_before == num_jobs, \
+            f"Should have {num_jobs} job records before deletion"
+        assert edu_count_before == num_education, \
+            f"Should have {num_education} education records before deletion"
+    
+        # Delete alumni (simulating delete form action)
+        delete_result = delete_alumni(db_session, alumni_id)
+        assert delete_result is True, "Delete operation should succeed"
+    
+        # Verify alumni is deleted
+        deleted_alumni = get_alumni_by_roll_number(db_session, data['roll_number'])
+        assert deleted_alumni is None, "Alumni should be deleted from database"
+    
+        # Verify all related records are deleted (cascade)
+        job_count_after = count_job_history(db_session, alumni_id)
+        edu_count_after = count_education_history(db_session, alumni_id)
+    
+        assert job_count_after == 0, \
+            "All job history records should be deleted via cascade"
+        assert edu_count_after == 0, \
+            "All education history records should be deleted via cascade"
@@ -4,17 +4,20 @@ Integration tests for dashboard statistics.
 Tests that the dashboard correctly displays statistics from the database.
 """
 
-import uuid
+import itertools
 
 import pytest
 
 from alumni_system.database.crud import (
-    create_alumni,
     get_alumni_count,
     get_unique_batches,
     get_unique_companies,
     get_unique_locations,
 )
+from tests.db_helpers import bulk_create_alumni
+
+# Unique 20-character roll numbers for this process
+_ROLL_COUNTER = itertools.count()
 
 
 def test_dashboard_statistics_integration(db_session):
@@ -30,28 +33,28 @@ def test_dashboard_statistics_integration(db_session):
     # Create test alumni with known data
     alumni_data = [
         {
-            'roll_number': str(uuid.uuid4())[:20],
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
             'name': 'Alice Smith',
             'batch': '2020',
             'current_company': 'Google',
             'location': 'Bangalore'
         },
         {
-            'roll_number': str(uuid.uuid4())[:20],
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
             'name': 'Bob Jones',
             'batch': '2020',
             'current_company': 'Microsoft',
             'location': 'Mumbai'
         },
         {
-            'roll_number': str(uuid.uuid4())[:20],
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
             'name': 'Charlie Brown',
             'batch': '2021',
             'current_company': 'Google',
             'location': 'Bangalore'
         },
         {
-            'roll_number': str(uuid.uuid4())[:20],
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
             'name': 'Diana Prince',
             'batch': '2021',
             'current_company': 'Amazon',
@@ -60,8 +63,7 @@ def test_dashboard_statistics_integration(db_session):
     ]
     
     # Create alumni
-    for data in alumni_data:
-        create_alumni(db_session, **data)
+    bulk_create_alumni(db_session, alumni_data)
     
     # Test count
     count = get_alumni_count(db_session)
@@ -111,21 +113,21 @@ def test_dashboard_statistics_with_null_values(db_session):
     # Create alumni with some null values
     alumni_data = [
         {
-            'roll_number': str(uuid.uuid4())[:20],
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
             'name': 'Alice Smith',
             'batch': '2020',
             'current_company': 'Google',
             'location': 'Bangalore'
         },
         {
-            'roll_number': str(uuid.uuid4())[:20],
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
             'name': 'Bob Jones',
             'batch': '2020',
             'current_company': None,  # No company
             'location': None  # No location
         },
         {
-            'roll_number': str(uuid.uuid4())[:20],
+            'roll_number': f"R{next(_ROLL_COUNTER):019d}",
             'name': 'Charlie Brown',
             'batch': None,  # No batch
             'current_company': 'Microsoft',
@@ -134,8 +136,7 @@ def test_dashboard_statistics_with_null_values(db_session):
     ]
     
     # Create alumni
-    for data in alumni_data:
-        create_alumni(db_session, **data)
+    bulk_create_alumni(db_session, alumni_data)
     
     # Test count (should count all alumni regardless of null values)
     count = get_alumni_count(db_session)
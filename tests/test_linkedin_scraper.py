@@ -279,3 +279,68 @@ async def test_checkpoint_in_pdf_download_raises_exception():
                     await scraper.download_profile_pdf("https://www.linkedin.com/in/testuser")
                 
                 assert "checkpoint" in str(exc_info.value).lower()
+
+
+@pytest.mark.asyncio
+async def test_scraper_loads_in_memory_cookies():
+    """Test that pre-read cookie bytes are loaded without touching the filesystem."""
+    cookies = b'[{"name": "li_at", "value": "token", "domain": ".linkedin.com", "path": "/"}]'
+    scraper = LinkedInScraper(cookies_file="does/not/exist.json", cookies=cookies)
+    
+    mock_context = AsyncMock()
+    scraper._context = mock_context
+    
+    assert await scraper._load_cookies() is True
+    mock_context.add_cookies.assert_awaited_once()
+    assert mock_context.add_cookies.await_args.args[0][0]["name"] == "li_at"
+    assert scraper._logged_in is True
+    assert scraper.get_current_account_email() == "cookie_auth"
+
+
+@pytest.mark.asyncio
+async def test_scraper_leaves_shared_browser_open():
+    """Test that a browser passed in by the caller is not closed by the scraper."""
+    browser = AsyncMock()
+    scraper = LinkedInScraper(browser=browser)
+    
+    await scraper.start()
+    browser.new_context.assert_awaited_once()
+    
+    await scraper.close()
+    browser.close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_scraper_relaunches_owned_browser_after_close():
+    """Test that start() after close() launches a new browser when the scraper owns it."""
+    def make_browser():
+        page = MagicMock()
+        page.close = AsyncMock()
+        context = AsyncMock()
+        context.new_page.return_value = page
+        browser = AsyncMock()
+        browser.new_context.return_value = context
+        return browser
+    
+    first_browser, second_browser = make_browser(), make_browser()
+    playwright = AsyncMock()
+    playwright.chromium.launch.side_effect = [first_browser, second_browser]
+    
+    with patch("alumni_system.scraper.linkedin_scraper.async_playwright") as mock_async_playwright:
+        mock_async_playwright.return_value.start = AsyncMock(return_value=playwright)
+        scraper = LinkedInScraper(browser=None)
+        
+        await scraper.start()
+        await scraper.close()
+        first_browser.close.assert_awaited_once()
+        assert scraper._browser is None
+        assert scraper._context is None
+        assert scraper._page is None
+        
+        await scraper.start()
+        assert playwright.chromium.launch.await_count == 2
+        second_browser.new_context.assert_awaited_once()
+        first_browser.new_context.assert_awaited_once()
+        
+        await scraper.close()
+        second_browser.close.assert_awaited_once()
@@ -411,3 +411,74 @@ def test_force_update_ignores_timestamps(
     for alumni in alumni_list:
         assert alumni.id in force_ids, \
             f"Alumni {alumni.id} should be included with force_update"
+
+
+@pytest.mark.asyncio
+async def test_get_browser_relaunches_disconnected_browser():
+    """
+    Test that the shared browser is relaunched once it reports being disconnected.
+    
+    A dead browser must be closed along with its Playwright driver and replaced,
+    instead of being handed to every later login, retry and profile in the job.
+    """
+    stale_browser = AsyncMock()
+    stale_browser.is_connected = Mock(return_value=True)
+    fresh_browser = AsyncMock()
+    fresh_browser.is_connected = Mock(return_value=True)
+    
+    first_playwright = AsyncMock()
+    first_playwright.chromium.launch.return_value = stale_browser
+    second_playwright = AsyncMock()
+    second_playwright.chromium.launch.return_value = fresh_browser
+    
+    orchestrator = ScrapingJobOrchestrator(
+        db=MagicMock(),
+        account_manager=AccountRotationManager(accounts=[], daily_limit=100),
+    )
+    
+    with patch("alumni_system.scraper.job.async_playwright") as mock_async_playwright:
+        mock_async_playwright.return_value.start = AsyncMock(
+            side_effect=[first_playwright, second_playwright]
+        )
+        
+        assert await orchestrator._get_browser() is stale_browser
+        # Still connected: the same browser is reused
+        assert await orchestrator._get_browser() is stale_browser
+        
+        stale_browser.is_connected.return_value = False
+        assert await orchestrator._get_browser() is fresh_browser
+        
+        stale_browser.close.assert_awaited_once()
+        first_playwright.stop.assert_awaited_once()
+        second_playwright.chromium.launch.assert_awaited_once()
+        
+        await orchestrator._close_browser()
+        fresh_browser.close.assert_awaited_once()
+        second_playwright.stop.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_with_closes_browser_launched_by_process_profile():
+    """
+    Test that leaving an ``async with`` block closes the shared browser.
+    
+    _process_profile() launches the browser but leaves it open for the next
+    profile, so callers outside the run_* methods need a way to release it.
+    """
+    browser = AsyncMock()
+    browser.is_connected = Mock(return_value=True)
+    playwright = AsyncMock()
+    playwright.chromium.launch.return_value = browser
+    
+    with patch("alumni_system.scraper.job.async_playwright") as mock_async_playwright:
+        mock_async_playwright.return_value.start = AsyncMock(return_value=playwright)
+        
+        async with ScrapingJobOrchestrator(
+            db=MagicMock(),
+            account_manager=AccountRotationManager(accounts=[], daily_limit=100),
+        ) as orchestrator:
+            assert await orchestrator._get_browser() is browser
+        
+        browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+        assert orchestrator._browser is None
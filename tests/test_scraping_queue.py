@@ -4,12 +4,7 @@ Tests for scraping queue CRUD operations.
 Tests the functionality of adding, retrieving, and managing items in the scraping queue.
 """
 
-import pytest
-from datetime import datetime
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from alumni_system.database.models import Alumni, Base, ScrapingQueue
+from alumni_system.database.models import Alumni, ScrapingQueue
 from alumni_system.database.crud import (
     add_to_scraping_queue,
     get_next_from_queue,
@@ -21,22 +16,6 @@ from alumni_system.database.crud import (
 )
 
 
-@pytest.fixture
-def db_session():
-    """Create a test database session."""
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(bind=engine)
-    
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    
-    yield session
-    
-    session.close()
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
-
-
 def test_add_to_scraping_queue(db_session):
     """Test adding an alumni to the scraping queue."""
     # Create an alumni